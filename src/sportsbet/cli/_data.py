@@ -12,7 +12,7 @@ import pandas as pd
 from rich.console import Console
 from rich.panel import Panel
 
-from ._options import get_config_path_option, get_data_path_option
+from ._options import get_config_path_option, get_data_path_option, get_mirror_path_option
 from ._utils import get_dataloader_cls, get_drop_na_thres, get_module, get_odds_type, get_param_grid, print_console
 
 
@@ -105,3 +105,24 @@ def fixtures(config_path: str, data_path: str) -> None:
             '[bold red]Fixtures data were empty',
         )
         console.print(warning)
+
+
+@dataloader.command()
+@get_config_path_option()
+@get_mirror_path_option()
+def mirror(config_path: str, mirror_path: str) -> None:
+    """Mirror the data files of a dataloader to a local directory."""
+    console = Console()
+    mod = get_module(config_path)
+    dataloader_cls = get_dataloader_cls(mod)
+    if dataloader_cls is None:
+        return
+    if not hasattr(dataloader_cls, 'mirror'):
+        warning = Panel.fit(
+            '[bold red]Dataloader does not support mirroring of its data files.',
+        )
+        console.print(warning)
+        return
+    param_grid = get_param_grid(mod)
+    dataloader_cls(param_grid).mirror(mirror_path)  # type: ignore[attr-defined]
+    console.print(Panel.fit(f'[bold green]Data files were mirrored to {mirror_path}'))
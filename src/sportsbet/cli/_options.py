@@ -34,3 +34,15 @@ def get_config_path_option() -> Callable[[FC], FC]:
         type=str,
         help='The path of the configuration file.',
     )
+
+
+def get_mirror_path_option() -> Callable[[FC], FC]:
+    """Get the mirror directory path option."""
+    return click.option(
+        '--mirror-path',
+        '-m',
+        nargs=1,
+        required=True,
+        type=str,
+        help='The path of the directory to mirror the data files.',
+    )
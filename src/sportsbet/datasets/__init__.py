@@ -3,12 +3,19 @@
 from __future__ import annotations
 
 from ._base import BaseDataLoader, load_dataloader
-from ._dummy import DummySoccerDataLoader
+from ._cache import DATA_CACHE, CacheInfo, DataCache
+from ._dummy import DummySoccerDataLoader, SyntheticSoccerDataLoader
 from ._soccer._data import SoccerDataLoader
+from ._soccer._utils import DownloadError
 
 __all__: list[str] = [
+    'DATA_CACHE',
     'BaseDataLoader',
+    'CacheInfo',
+    'DataCache',
+    'DownloadError',
     'DummySoccerDataLoader',
     'SoccerDataLoader',
+    'SyntheticSoccerDataLoader',
     'load_dataloader',
 ]
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
+import weakref
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Hashable, Mapping
 from difflib import SequenceMatcher
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import ClassVar
+from types import MethodType
+from typing import ClassVar, TypeVar
 
 import cloudpickle
 import numpy as np
@@ -14,7 +19,8 @@ from sklearn.model_selection import ParameterGrid
 from sklearn.utils import check_scalar
 from typing_extensions import Self
 
-from .. import FixturesData, Outputs, Param, ParamGrid, Schema, TrainData
+from .. import BoolData, FixturesData, Outputs, Param, ParamGrid, Schema, TrainData
+from ._cache import DATA_CACHE
 
 
 def _create_names_mapping_table(data_source1: pd.DataFrame, data_source2: pd.DataFrame, keys: list) -> pd.DataFrame:
@@ -51,6 +57,51 @@ def _create_names_mapping_table(data_source1: pd.DataFrame, data_source2: pd.Dat
     return names_mapping
 
 
+_DATA_TYPES_MAPPING: dict[type, np.dtype] = {np.datetime64: np.dtype('datetime64[ns]')}
+
+T = TypeVar('T')
+
+
+class _ClassOrInstanceMethod:
+    """Method that is bound to the instance when it is accessed from an instance and to the class otherwise."""
+
+    def __init__(self: _ClassOrInstanceMethod, method: Callable) -> None:
+        self.method = method
+        self.__doc__ = method.__doc__
+
+    def __get__(self: _ClassOrInstanceMethod, instance: object, owner: type) -> MethodType:
+        return MethodType(self.method, owner if instance is None else instance)
+
+
+@lru_cache
+def _compile_schema(schema: tuple[tuple[str, type], ...]) -> dict[str, type]:
+    """Compile the schema to a mapping of columns to data types."""
+    return dict(schema)
+
+
+def _convert_data_types(data: pd.DataFrame, data_types: Mapping[str, type]) -> pd.DataFrame:
+    """Cast the data type of columns to the data types of the mapping.
+
+    Only the columns that do not have already the data type of the mapping are converted.
+    """
+    converted_cols = {}
+    for col, data_type in data_types.items():
+        if col not in data.columns or data[col].dtype == _DATA_TYPES_MAPPING.get(data_type, data_type):
+            continue
+        if data_type is object and isinstance(data[col].dtype, pd.CategoricalDtype):
+            continue
+        data_col = data[col]
+        if data_type is np.datetime64:
+            converted_cols[col] = pd.to_datetime(data_col)
+            continue
+        if data_type is float or data_type is np.int64:
+            if data_col.dtype == object:
+                data_col = data_col.replace('-', np.nan).infer_objects()
+            data_col = data_col.fillna(-1 if data_type is np.int64 else np.nan)
+        converted_cols[col] = data_col.to_numpy().astype(data_type)
+    return data.assign(**converted_cols) if converted_cols else data
+
+
 class BaseDataLoader(metaclass=ABCMeta):
     """The base class for dataloaders.
 
@@ -61,92 +112,111 @@ class BaseDataLoader(metaclass=ABCMeta):
     SCHEMA: ClassVar[Schema] = []
     OUTPUTS: ClassVar[Outputs] = []
 
-    def __init__(self: Self, param_grid: ParamGrid | None = None) -> None:
+    def __init__(self: Self, param_grid: ParamGrid | None = None, categorical: bool = False) -> None:
         self.param_grid = param_grid
+        self.categorical = categorical
 
     @classmethod
     @abstractmethod
     def _get_full_param_grid(cls: type[BaseDataLoader]) -> ParameterGrid:
         return ParameterGrid([])
 
+    def _get_available_param_grid(self: Self) -> ParameterGrid:
+        """Get the parameters grid of the data that are available to the dataloader."""
+        return self._get_full_param_grid()
+
     @abstractmethod
     def _get_data(self: Self) -> pd.DataFrame:
         return pd.DataFrame()
 
+    def _get_data_key(self: Self) -> Hashable | None:
+        """Get the key of the data returned by `_get_data` in the shared cache `DATA_CACHE`.
+
+        The default value `None` means that the data are not shared through the cache.
+        """
+        return None
+
     @staticmethod
     def _cols(data: pd.DataFrame, col_type: str) -> list[str]:
         if col_type == 'input':
             return [col for col in data.columns if not col.startswith('target')]
         return [col for col in data.columns if col.startswith(col_type)]
 
+    def _get_unused_cols(self: Self) -> list[str]:
+        """Get the target columns of the schema that are not used by any output."""
+        output_keys = {col.split('__')[-1] for col, _ in self.OUTPUTS}
+        return [col for col, _ in self.SCHEMA if col.startswith('target') and col.split('__')[-1] not in output_keys]
+
+    def _get_param_grid_key(self: Self) -> tuple:
+        """Get a hashable representation of the checked parameters grid."""
+        return tuple(
+            tuple((name, None if pd.isna(value) else value) for name, value in sorted(params.items()))
+            for params in self.param_grid_
+        )
+
     def _check_param_grid(self: Self) -> Self:
         """Check the parameters grid."""
-        full_param_grid = self._get_full_param_grid()
+        full_param_grid = self._get_available_param_grid()
         if self.param_grid is not None:
             full_param_grid_df = self._convert_data_types(pd.DataFrame(full_param_grid))
 
+            # Empty parameters
+            params_list = list(ParameterGrid(self.param_grid))
+            if not all(params_list):
+                error_msg = 'Parameter grid includes an empty dictionary of parameters.'
+                raise ValueError(error_msg)
+
             # False names
-            param_grid_df = self._convert_data_types(pd.DataFrame(ParameterGrid(self.param_grid)))
             available_names = set(full_param_grid_df.columns)
-            names = set(param_grid_df.columns)
+            names = {name for params in params_list for name in params}
             if not available_names.issuperset(names):
                 error_msg = (
                     'Parameter grid includes the parameters name(s) '
                     f'{list(names.difference(available_names))} that are not not '
-                    'allowed by available data.',
+                    'allowed by available data.'
                 )
                 raise ValueError(error_msg)
 
             # False values
+            full_param_grid_df = full_param_grid_df.assign(_position=np.arange(full_param_grid_df.shape[0]))
             param_grid = []
-            for params in ParameterGrid(self.param_grid):
+            for params_names in dict.fromkeys(tuple(params) for params in params_list):
+                orders = [order for order, params in enumerate(params_list) if tuple(params) == params_names]
                 params_df = self._convert_data_types(
-                    pd.DataFrame({name: [value] for name, value in params.items()}),
-                ).merge(full_param_grid_df)
-                if params_df.size == 0:
-                    error_msg = (
-                        'Parameter grid includes the parameters value(s) '
-                        f'{params} that are not allowed by available data.',
-                    )
-                    raise ValueError(error_msg)
-                params_df = pd.DataFrame(params_df).merge(full_param_grid_df)
-                param_grid.append(params_df)
-            param_grid_df = pd.concat(param_grid, ignore_index=True)
+                    pd.DataFrame([params_list[order] for order in orders], columns=list(params_names)),
+                ).assign(_order=orders)
+                param_grid.append(params_df.merge(full_param_grid_df, on=list(params_names)))
+            param_grid_df = pd.concat(param_grid, ignore_index=True).sort_values(['_order', '_position'], kind='stable')
+            missing_orders = np.setdiff1d(np.arange(len(params_list)), param_grid_df['_order'])
+            if missing_orders.size > 0:
+                error_msg = (
+                    'Parameter grid includes the parameters value(s) '
+                    f'{params_list[missing_orders[0]]} that are not allowed by available data.'
+                )
+                raise ValueError(error_msg)
+            param_grid_df = param_grid_df.drop(columns=['_order', '_position'])
             self.param_grid_ = ParameterGrid(
-                [{k: [v] for k, v in params.to_dict().items()} for _, params in param_grid_df.iterrows()],
+                [{k: [v] for k, v in params.items()} for params in param_grid_df.to_dict('records')],
             )
         else:
             self.param_grid_ = full_param_grid
         return self
 
+    @classmethod
+    def _get_data_types(cls: type[BaseDataLoader]) -> dict[str, type]:
+        """Get the mapping of columns to data types that is compiled from the schema."""
+        return _compile_schema(tuple(cls.SCHEMA))
+
     def _convert_data_types(self: Self, data: pd.DataFrame) -> pd.DataFrame:
-        """Cast the data type of columns."""
-        data_types = {data_type for _, data_type in self.SCHEMA}
-        for data_type in data_types:
-            converted_cols = list(
-                {
-                    col
-                    for col, selected_data_type in self.SCHEMA
-                    if selected_data_type is data_type and col in data.columns
-                },
-            )
-            if converted_cols:
-                data_converted_cols = data[converted_cols]
-                if data_type is float or data_type is np.int64:
-                    data_converted_cols = data_converted_cols.replace('-', np.nan)
-                    data_converted_cols = data_converted_cols.infer_objects().fillna(
-                        -1 if data_type is np.int64 else np.nan,
-                    )
-                data[converted_cols] = (
-                    data_converted_cols.to_numpy().astype(data_type)
-                    if data_type is not np.datetime64
-                    else pd.to_datetime(data_converted_cols.iloc[:, 0])
-                )
-        return data
+        """Cast the data type of columns.
 
-    def _validate_data(self: Self) -> pd.DataFrame:
-        """Validate the data."""
-        data = self._get_data()
+        Only the columns that do not have already the data type of the schema are converted.
+        """
+        return _convert_data_types(data, self._get_data_types())
+
+    @staticmethod
+    def _check_data(data: object) -> pd.DataFrame:
+        """Check the type, size and the `fixtures` and `date` columns of the data."""
         if not isinstance(data, pd.DataFrame):
             error_msg = f'Data should be a pandas dataframe. Got {type(data).__name__} instead.'
             raise TypeError(error_msg)
@@ -161,12 +231,28 @@ class BaseDataLoader(metaclass=ABCMeta):
         if 'date' not in data.columns or data['date'].dtype.name != 'datetime64[ns]':
             error_msg = 'Data should include a datetime column `date` to represent the date.'
             raise KeyError(error_msg)
-        if self.SCHEMA and not {col for col, _ in self.SCHEMA}.issuperset(data.columns.difference(['fixtures'])):
+        return data
+
+    def _validate_data(self: Self) -> pd.DataFrame:
+        """Validate the data."""
+        data_key = self._get_data_key()
+        key = self._get_param_grid_key(), self.categorical, data_key
+        cached_key, raw_data_ref, validated_data = getattr(self, '_validated_data_cache', (None, None, None))
+
+        # Reuse the validated data while the raw data are alive or when they are too large for `DATA_CACHE`
+        if cached_key == key and data_key is not None and (raw_data_ref is None or raw_data_ref() is not None):
+            return validated_data
+        data = self._get_data()
+        if cached_key == key and raw_data_ref is not None and raw_data_ref() is data:
+            return validated_data
+        raw_data_ref = weakref.ref(self._check_data(data))
+        data_types = self._get_data_types()
+        if data_types and not data_types.keys() >= set(data.columns.difference(['fixtures'])):
             error_msg = 'Data contains columns not included in schema.'
             raise ValueError(error_msg)
 
         # Reorder columns
-        data = data[[col for col, _ in self.SCHEMA if col in data.columns] + ['fixtures']]
+        data = data[[col for col in data_types if col in data.columns] + ['fixtures']]
 
         # Set date as index
         data = data.set_index('date').sort_values('date')
@@ -177,10 +263,17 @@ class BaseDataLoader(metaclass=ABCMeta):
         # Check consistency with available parameters
         mask = data['fixtures']
         train_data = data[~mask].drop(columns=['fixtures'])
-        full_param_grid_df = pd.DataFrame(self._get_full_param_grid())
+        full_param_grid_df = pd.DataFrame(self._get_available_param_grid())
         param_grid_df = full_param_grid_df[
             [col for col in full_param_grid_df.columns if col in train_data.columns]
         ].drop_duplicates()
+        param_grid_df = param_grid_df.astype(
+            {
+                col: train_data[col].dtype
+                for col in param_grid_df.columns
+                if isinstance(train_data[col].dtype, pd.CategoricalDtype)
+            },
+        )
         train_data_params = train_data[param_grid_df.columns].drop_duplicates().reset_index(drop=True)
         try:
             pd.testing.assert_frame_equal(train_data_params.merge(param_grid_df), train_data_params, check_dtype=False)
@@ -188,18 +281,43 @@ class BaseDataLoader(metaclass=ABCMeta):
             error_msg = 'The raw data and available parameters are incompatible.'
             raise ValueError(error_msg) from e
 
+        # Convert names to categoricals
+        if self.categorical:
+            data = self._convert_categorical(data)
+
+        # Raw data that are not admitted to `DATA_CACHE` are not referenced, so that they are not loaded again
+        if data_key is not None and data_key not in DATA_CACHE:
+            raw_data_ref = None
+        self._validated_data_cache = key, raw_data_ref, data
+
         return data
 
+    def _convert_categorical(self: Self, data: pd.DataFrame) -> pd.DataFrame:
+        """Convert the columns with object data type to categoricals.
+
+        The new categories are sorted and appended to the existing categories.
+        """
+        categories = getattr(self, 'categories_', {})
+        cols = [col for col, data_type in self._get_data_types().items() if data_type is object and col in data.columns]
+        self.categories_ = {}
+        for col in cols:
+            col_categories = categories.get(col, pd.Index([], dtype=object))
+            values = pd.Index(data[col].dropna().unique(), dtype=object)
+            self.categories_[col] = col_categories.append(values.difference(col_categories).sort_values())
+        return data.astype({col: pd.CategoricalDtype(self.categories_[col]) for col in cols})
+
     def _extract_train_data(self: Self, data: pd.DataFrame) -> pd.DataFrame:
         data = data[~data['fixtures']].drop(columns=['fixtures'])
-        data = data.reset_index().merge(pd.DataFrame(self.param_grid_)).set_index('date').sort_index()
+        param_grid_df = pd.DataFrame(self.param_grid_)
+        param_grid_df = param_grid_df.astype(
+            {col: data[col].dtype for col in param_grid_df.columns if isinstance(data[col].dtype, pd.CategoricalDtype)},
+        )
+        data = data.reset_index().merge(param_grid_df).set_index('date').sort_index()
         return data
 
-    def _check_dropped_na_cols(self: Self, data: pd.DataFrame, drop_na_thres: float) -> Self:
+    def _check_dropped_na_cols(self: Self, data: pd.DataFrame, counts: pd.Series, drop_na_thres: float) -> Self:
         thres = int(data.shape[0] * drop_na_thres)
-        dropped_all_na_cols = data.columns.difference(data.dropna(axis=1, how='all').columns)
-        dropped_thres_na_cols = data.columns.difference(data.dropna(axis=1, thresh=thres).columns)
-        dropped_na_cols = dropped_all_na_cols.union(dropped_thres_na_cols)
+        dropped_na_cols = counts.index[(counts == 0) | (counts < thres)]
         self.dropped_na_cols_ = pd.Index(
             [col for col in data.columns if col in dropped_na_cols and col not in self._cols(data, 'target')],
             dtype=object,
@@ -209,10 +327,58 @@ class BaseDataLoader(metaclass=ABCMeta):
             raise ValueError(error_msg)
         return self
 
+    def _get_counts(self: Self) -> pd.Series | None:
+        """Get the number of non missing values of each column of the training data.
+
+        It is used to get the available odds types without loading the data. The
+        default value `None` means that the statistics are not available.
+        """
+        return None
+
+    @staticmethod
+    def _get_odds_types(counts: pd.Series) -> list[str]:
+        """Get the odds types of the odds columns with non missing values."""
+        return sorted(
+            {col.split('__')[1] for col, count in counts.items() if col.startswith('odds') and count > 0},
+        )
+
+    @staticmethod
+    def _check_dtype(dtype: str | type | None) -> np.dtype | None:
+        if dtype is None:
+            return None
+        error_msg = f'Parameter `dtype` should be a floating point data type. Got `{dtype}` instead.'
+        try:
+            checked_dtype = np.dtype(dtype)
+        except TypeError as e:
+            raise TypeError(error_msg) from e
+        if checked_dtype.kind != 'f':
+            raise ValueError(error_msg)
+        return checked_dtype
+
+    def _convert_float_dtype(self: Self, data: pd.DataFrame) -> pd.DataFrame:
+        if self.dtype_ is None:
+            return data
+        float_cols = [col for col in self.input_cols_ if data[col].dtype.kind == 'f' and data[col].dtype != self.dtype_]
+        return data.astype(dict.fromkeys(float_cols, self.dtype_)) if float_cols else data
+
+    @staticmethod
+    async def _run_in_executor(func: Callable[..., T], *args: object) -> T:
+        """Run the function in the default executor of the running event loop."""
+        return await asyncio.get_running_loop().run_in_executor(None, partial(func, *args))
+
+    def _extract_outputs(self: Self, data: pd.DataFrame) -> BoolData:
+        """Extract the outputs of the output columns into a boolean matrix."""
+        outputs = np.empty((data.shape[0], self.output_cols_.size), dtype=bool)
+        outputs_mapping = dict(self.OUTPUTS)
+        for ind, col in enumerate(self.output_cols_):
+            outputs[:, ind] = outputs_mapping[col](data)
+        return outputs
+
     def extract_train_data(
         self: Self,
         drop_na_thres: float = 0.0,
         odds_type: str | None = None,
+        dtype: str | type | None = None,
     ) -> TrainData:
         """Extract the training data.
 
@@ -245,6 +411,11 @@ class BaseDataLoader(metaclass=ABCMeta):
                 prefixes returned by the method `get_odds_types`. If `odds_type=None`
                 then no odds are returned.
 
+            dtype:
+                The floating point data type of the input and odds data. It is also used
+                for the fixtures data. If `dtype=None` then the data type of the schema is
+                kept, while `dtype='float32'` halves the memory of the data.
+
         Returns:
             (X, Y, O):
                 Each of the components represent the training input data `X`, the
@@ -262,11 +433,11 @@ class BaseDataLoader(metaclass=ABCMeta):
 
         # Check dropped columns
         self.drop_na_thres_ = check_scalar(drop_na_thres, 'drop_na_thres', float, min_val=0.0, max_val=1.0)
-        self._check_dropped_na_cols(data, drop_na_thres)
+        counts = data.notna().sum()
+        self._check_dropped_na_cols(data, counts, drop_na_thres)
 
         # Check odds type
-        dropped_all_na_cols = data.columns.difference(data.dropna(axis=1, how='all').columns)
-        odds_types = sorted({col.split('__')[1] for col in self._cols(data, 'odds') if col not in dropped_all_na_cols})
+        odds_types = self._get_odds_types(counts)
         if odds_type is not None and odds_type not in odds_types:
             error_msg = (
                 f'Parameter `odds_type` should be a prefix of available odds columns. Got `{odds_type}` instead.'
@@ -277,6 +448,9 @@ class BaseDataLoader(metaclass=ABCMeta):
                 raise TypeError(error_msg)
         self.odds_type_ = odds_type
 
+        # Check data type
+        self.dtype_ = self._check_dtype(dtype)
+
         # Extract input, odds and output columns
         output_keys = [col.split('__')[1:] for col, _ in self.OUTPUTS]
         target_keys = [col.split('__')[2:] for col in self._cols(data, 'target')]
@@ -311,12 +485,10 @@ class BaseDataLoader(metaclass=ABCMeta):
         data = self._convert_data_types(data)
 
         # Extract outputs
-        Y_train = []
-        outputs_mapping = dict(self.OUTPUTS)
-        for col in self.output_cols_:
-            func = outputs_mapping[col]
-            Y_train.append(pd.Series(func(data[self.target_cols_]), name=col))
-        Y_train = pd.concat(Y_train, axis=1).reset_index(drop=True)
+        Y_train = pd.DataFrame(self._extract_outputs(data[self.target_cols_]), columns=self.output_cols_)
+
+        # Convert floating point data type
+        data = self._convert_float_dtype(data)
 
         # Extract odds
         O_train = data[self.odds_cols_].reset_index(drop=True) if self.odds_type_ is not None else None
@@ -327,6 +499,39 @@ class BaseDataLoader(metaclass=ABCMeta):
 
         return self.train_data_
 
+    async def aextract_train_data(
+        self: Self,
+        drop_na_thres: float = 0.0,
+        odds_type: str | None = None,
+        dtype: str | type | None = None,
+    ) -> TrainData:
+        """Extract asynchronously the training data.
+
+        It is the asynchronous version of the method `extract_train_data`. The
+        data are downloaded and parsed in a worker thread, therefore the event
+        loop of the caller is not blocked and the data of multiple dataloader
+        objects can be extracted concurrently. Concurrent calls should use
+        different dataloader objects, since the fitted attributes are
+        overwritten.
+
+        Args:
+            drop_na_thres:
+                The threshold that specifies the input columns to drop. It is a float in
+                the `[0.0, 1.0]` range.
+
+            odds_type:
+                The selected odds type. If `odds_type=None` then no odds are returned.
+
+            dtype:
+                The floating point data type of the input and odds data.
+
+        Returns:
+            (X, Y, O):
+                Each of the components represent the training input data `X`, the
+                multi-output targets `Y` and the corresponding odds `O`, respectively.
+        """
+        return await self._run_in_executor(self.extract_train_data, drop_na_thres, odds_type, dtype)
+
     def extract_fixtures_data(self: Self) -> FixturesData:
         """Extract the fixtures data.
 
@@ -369,6 +574,9 @@ class BaseDataLoader(metaclass=ABCMeta):
         # Remove past data
         data = data.loc[data.index >= pd.Timestamp(pd.to_datetime('today').date())]
 
+        # Convert floating point data type
+        data = self._convert_float_dtype(data)
+
         # Extract odds
         O_fix = data[self.odds_cols_].reset_index(drop=True) if self.odds_type_ is not None else None
 
@@ -376,6 +584,21 @@ class BaseDataLoader(metaclass=ABCMeta):
 
         return self.fixtures_data_
 
+    async def aextract_fixtures_data(self: Self) -> FixturesData:
+        """Extract asynchronously the fixtures data.
+
+        It is the asynchronous version of the method `extract_fixtures_data`. The
+        data are downloaded and parsed in a worker thread, therefore the event
+        loop of the caller is not blocked.
+
+        Returns:
+            (X, None, O):
+                Each of the components represent the fixtures input data `X`, the
+                multi-output targets `Y` equal to `None` and the
+                corresponding odds `O`, respectively.
+        """
+        return await self._run_in_executor(self.extract_fixtures_data)
+
     def save(self: Self, path: str) -> Self:
         """Save the dataloader object.
 
@@ -391,23 +614,44 @@ class BaseDataLoader(metaclass=ABCMeta):
             cloudpickle.dump(self, file)
         return self
 
-    @classmethod
-    def get_all_params(cls: type[BaseDataLoader]) -> list[Param]:
+    def refresh(self: Self) -> Self:
+        """Refresh the data.
+
+        It loads again the parts of the data that may have changed since they
+        were loaded, so that the next extraction of the training or fixtures data
+        includes them.
+
+        Returns:
+            self:
+                The dataloader object.
+        """
+        self.__dict__.pop('_validated_data_cache', None)
+        return self
+
+    def __getstate__(self: Self) -> dict:
+        state = self.__dict__.copy()
+        state.pop('_validated_data_cache', None)
+        return state
+
+    @_ClassOrInstanceMethod
+    def get_all_params(self: BaseDataLoader | type[BaseDataLoader]) -> list[Param]:
         """Get the available parameters.
 
         It can be used to get the allowed names and values for the
-        `param_grid` parameter of the dataloader object.
+        `param_grid` parameter of the dataloader object. When it is called
+        from a dataloader object, the parameters are the ones that are
+        available to it.
 
         Returns:
             param_grid: list
                 A list of all allowed params and values.
         """
-        full_param_grid = cls._get_full_param_grid()
+        full_param_grid = self._get_full_param_grid() if isinstance(self, type) else self._get_available_param_grid()
         params_names = sorted({param_name for params in full_param_grid for param_name in params})
         all_params = sorted(
             full_param_grid,
             key=lambda params: tuple(
-                params.get(name, '' if dict(cls.SCHEMA)[name] is object else 0) for name in params_names
+                params.get(name, '' if dict(self.SCHEMA)[name] is object else 0) for name in params_names
             ),
         )
         return all_params
@@ -425,16 +669,26 @@ class BaseDataLoader(metaclass=ABCMeta):
         # Check param grid
         self._check_param_grid()
 
-        # Validate the data
-        data = self._validate_data()
+        # Get statistics of missing values
+        counts = self._get_counts()
+        if counts is None:
+            data = self._extract_train_data(self._validate_data())
+            counts = data.notna().sum()
 
-        # Extract train data
-        data = self._extract_train_data(data)
+        return self._get_odds_types(counts)
 
-        # Drop columns with only missing values
-        dropped_all_na_cols = data.columns.difference(data.dropna(axis=1, how='all').columns)
+    async def aget_odds_types(self: Self) -> list[str]:
+        """Get asynchronously the available odds types.
 
-        return sorted({col.split('__')[1] for col in self._cols(data, 'odds') if col not in dropped_all_na_cols})
+        It is the asynchronous version of the method `get_odds_types`. The
+        data are downloaded and parsed in a worker thread, therefore the event
+        loop of the caller is not blocked.
+
+        Returns:
+            odds_types:
+                A list of available odds types.
+        """
+        return await self._run_in_executor(self.get_odds_types)
 
 
 def load_dataloader(path: str) -> BaseDataLoader:
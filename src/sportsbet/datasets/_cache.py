@@ -0,0 +1,170 @@
+"""Includes the cache of the data that are shared by the dataloaders."""
+
+# Author: Georgios Douzas <gdouzas@icloud.com>
+# License: MIT
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from collections.abc import Hashable
+from threading import RLock
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+from sklearn.utils import check_scalar
+from typing_extensions import Self
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of the data cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    size: int
+    max_size: int
+    length: int
+
+
+def _get_size(value: object) -> int:
+    """Get the size in bytes of the value."""
+    if isinstance(value, pd.DataFrame | pd.Series):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, tuple | list):
+        return sum(_get_size(item) for item in value)
+    return 0
+
+
+class DataCache:
+    """Bounded cache of the dataloaders data.
+
+    The loaded data of the dataloaders are stored in the cache `DATA_CACHE`
+    that is shared by all dataloaders of the process. The total size of the
+    cached data is bounded by `max_size` and the least recently used data are
+    evicted when it is exceeded. Data that are larger than `max_size` are
+    not cached.
+
+    Args:
+        max_size:
+            The maximum total size of the cached data in bytes.
+
+    Examples:
+        >>> import pandas as pd
+        >>> from sportsbet.datasets import DataCache
+        >>> cache = DataCache(max_size=2 ** 10)
+        >>> cache.put('data', pd.DataFrame({'odds': [2.0, 3.5]})).get('data')
+           odds
+        0   2.0
+        1   3.5
+        >>> cache.info().hits, cache.info().length
+        (1, 1)
+        >>> cache.clear().info()
+        CacheInfo(hits=0, misses=0, evictions=0, size=0, max_size=1024, length=0)
+    """
+
+    def __init__(self: Self, max_size: int = 2**30) -> None:
+        self.max_size = check_scalar(max_size, 'max_size', int, min_val=0)
+        self._entries: OrderedDict[Hashable, tuple[object, int]] = OrderedDict()
+        self._lock = RLock()
+        self._hits = self._misses = self._evictions = self._size = 0
+
+    def _evict(self: Self) -> None:
+        while self._size > self.max_size:
+            _, (_, size) = self._entries.popitem(last=False)
+            self._size -= size
+            self._evictions += 1
+
+    def __contains__(self: Self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def get(self: Self, key: Hashable) -> object:
+        """Get the cached value of the key.
+
+        Args:
+            key:
+                The key of the value.
+
+        Returns:
+            value:
+                The cached value or `None` if the key is not cached.
+        """
+        with self._lock:
+            if key not in self._entries:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key][0]
+
+    def put(self: Self, key: Hashable, value: object) -> Self:
+        """Cache the value of the key.
+
+        Args:
+            key:
+                The key of the value.
+
+            value:
+                The value to cache. Its size is the memory usage of the
+                dataframes and arrays it contains.
+
+        Returns:
+            self:
+                The data cache object.
+        """
+        size = _get_size(value)
+        with self._lock:
+            self.pop(key)
+            if size <= self.max_size:
+                self._entries[key] = value, size
+                self._size += size
+                self._evict()
+        return self
+
+    def pop(self: Self, key: Hashable) -> object:
+        """Remove the cached value of the key.
+
+        Args:
+            key:
+                The key of the value.
+
+        Returns:
+            value:
+                The removed value or `None` if the key is not cached.
+        """
+        with self._lock:
+            if key not in self._entries:
+                return None
+            value, size = self._entries.pop(key)
+            self._size -= size
+            return value
+
+    def clear(self: Self) -> Self:
+        """Remove all cached values and reset the statistics.
+
+        Returns:
+            self:
+                The data cache object.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._size = 0
+        return self
+
+    def info(self: Self) -> CacheInfo:
+        """Get the statistics of the cache.
+
+        Returns:
+            info:
+                The number of hits, misses and evictions, the total size of
+                the cached data, the maximum size and the number of cached values.
+        """
+        with self._lock:
+            self._evict()
+            return CacheInfo(self._hits, self._misses, self._evictions, self._size, self.max_size, len(self._entries))
+
+
+DATA_CACHE = DataCache()
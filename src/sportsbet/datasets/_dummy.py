@@ -5,17 +5,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime, timedelta
-from typing import ClassVar
+from typing import ClassVar, cast
 
 import numpy as np
 import pandas as pd
 import pytz
 from sklearn.model_selection import ParameterGrid
+from sklearn.utils import check_scalar
 from typing_extensions import Self
 
-from .. import FixturesData, Outputs, ParamGrid, Schema, TrainData
+from .. import FixturesData, Outputs, Param, ParamGrid, Schema, TrainData
 from ._base import BaseDataLoader
+from ._cache import DATA_CACHE
 
 OVER_UNDER = 2.5
 
@@ -37,11 +40,22 @@ class DummySoccerDataLoader(BaseDataLoader):
             `param_grid` parameter of the scikit-learn's ParameterGrid class.
             The default value `None` corresponds to all parameters.
 
+        categorical:
+            Whether to return the columns of the schema with `object` data type,
+            i.e. the league and teams names, as pandas categoricals. The categories
+            are shared by the training and fixtures data, while new categories are
+            appended to the existing ones, so that the codes of the categories
+            remain stable.
+
     Attributes:
         param_grid_ (ParameterGrid):
             The checked value of parameters grid. It includes all possible parameters if
             `param_grid` is `None`.
 
+        categories_ (dict[str, pd.Index]):
+            The categories of the categorical columns. It is only available when
+            `categorical` is `True`.
+
         dropped_na_cols_ (pd.Index):
             The columns with missing values that are dropped.
 
@@ -51,6 +65,9 @@ class DummySoccerDataLoader(BaseDataLoader):
         odds_type_ (str | None):
             The checked value of `odds_type`.
 
+        dtype_ (np.dtype | None):
+            The checked value of `dtype`.
+
         input_cols_ (pd.Index):
             The columns of `X_train` and `X_fix`.
 
@@ -366,8 +383,8 @@ class DummySoccerDataLoader(BaseDataLoader):
         },
     )
 
-    def __init__(self: Self, param_grid: ParamGrid | None = None) -> None:
-        super().__init__(param_grid)
+    def __init__(self: Self, param_grid: ParamGrid | None = None, categorical: bool = False) -> None:
+        super().__init__(param_grid, categorical)
 
     @classmethod
     def _get_full_param_grid(cls: type[DummySoccerDataLoader]) -> ParameterGrid:
@@ -391,6 +408,7 @@ class DummySoccerDataLoader(BaseDataLoader):
         self: Self,
         drop_na_thres: float = 0.0,
         odds_type: str | None = None,
+        dtype: str | type | None = None,
     ) -> TrainData:
         """Extract the training data.
 
@@ -423,12 +441,17 @@ class DummySoccerDataLoader(BaseDataLoader):
                 prefixes returned by the method `get_odds_types`. If `odds_type=None`
                 then no odds are returned.
 
+            dtype:
+                The floating point data type of the input and odds data. It is also used
+                for the fixtures data. If `dtype=None` then the data type of the schema is
+                kept, while `dtype='float32'` halves the memory of the data.
+
         Returns:
             (X, Y, O):
                 Each of the components represent the training input data `X`, the
                 multi-output targets `Y` and the corresponding odds `O`, respectively.
         """
-        return super().extract_train_data(drop_na_thres, odds_type)
+        return super().extract_train_data(drop_na_thres, odds_type, dtype)
 
     def extract_fixtures_data(self: Self) -> FixturesData:
         """Extract the fixtures data.
@@ -457,3 +480,331 @@ class DummySoccerDataLoader(BaseDataLoader):
                 corresponding odds `O`, respectively.
         """
         return super().extract_fixtures_data()
+
+
+class SyntheticSoccerDataLoader(DummySoccerDataLoader):
+    """Dataloader for synthetic soccer data.
+
+    The data follow the schema of `DummySoccerDataLoader` but they are generated
+    for any number of leagues, divisions, seasons and teams, therefore they can be
+    used to benchmark the dataloaders and bettors at scale without downloading.
+
+    Each season is a double round robin tournament. The goals of each match follow
+    a Poisson distribution with rates that depend on the attack and defence strengths
+    of the teams and the home advantage. The odds are the inverse of the match
+    probabilities of the same model, increased by the margin of each bookmaker and
+    perturbed by random noise. The generation is reproducible, since each season has
+    its own random generator derived from `random_state`, and only the seasons
+    selected by `param_grid` are generated, in chunks of `chunk_size` matches, directly
+    into preallocated arrays. The league and teams names are always pandas categoricals,
+    so that the generated data do not include any text.
+
+    Read more in the [user guide][user-guide].
+
+    Args:
+        param_grid:
+            It selects the type of information that the data include. The keys of
+            dictionaries might be parameters like `'league'` or `'division'` while
+            the values are sequences of allowed values. It works in a similar way as the
+            `param_grid` parameter of the scikit-learn's ParameterGrid class.
+            The default value `None` corresponds to all parameters.
+
+        categorical:
+            Whether to replace the categories of the league and teams names by the
+            sorted names that the data include.
+
+        n_leagues:
+            The number of leagues.
+
+        n_divisions:
+            The number of divisions of each league.
+
+        n_seasons:
+            The number of seasons of each division.
+
+        n_teams:
+            The number of teams of each division.
+
+        start_year:
+            The year of the first season.
+
+        chunk_size:
+            The approximate number of matches that are generated at once.
+
+        random_state:
+            The seed of the random generators.
+
+    Attributes:
+        param_grid_ (ParameterGrid):
+            The checked value of parameters grid. It includes all possible parameters if
+            `param_grid` is `None`.
+
+        categories_ (dict[str, pd.Index]):
+            The categories of the categorical columns. It is only available when
+            `categorical` is `True`.
+
+        dropped_na_cols_ (pd.Index):
+            The columns with missing values that are dropped.
+
+        drop_na_thres_(float):
+            The checked value of `drop_na_thres`.
+
+        odds_type_ (str | None):
+            The checked value of `odds_type`.
+
+        dtype_ (np.dtype | None):
+            The checked value of `dtype`.
+
+        input_cols_ (pd.Index):
+            The columns of `X_train` and `X_fix`.
+
+        output_cols_ (pd.Index):
+            The columns of `Y_train` and `Y_fix`.
+
+        odds_cols_ (pd.Index):
+            The columns of `O_train` and `O_fix`.
+
+        target_cols_ (pd.Index):
+            The columns used for the extraction of output and odds columns.
+
+        train_data_ (TrainData):
+            The tuple (X, Y, O) that represents the training data as extracted from
+            the method `extract_train_data`.
+
+        fixtures_data_ (FixturesData):
+            The tuple (X, Y, O) that represents the fixtures data as extracted from
+            the method `extract_fixtures_data`.
+
+    Examples:
+        >>> from sportsbet.datasets import SyntheticSoccerDataLoader
+        >>> dataloader = SyntheticSoccerDataLoader(n_leagues=2, n_seasons=3, n_teams=10)
+        >>> X_train, Y_train, O_train = dataloader.extract_train_data(odds_type='interwetten')
+        >>> X_train.shape
+        (1080, 15)
+        >>> Y_train.columns.tolist()
+        ['output__home_win__full_time_goals', 'output__draw__full_time_goals', 'output__away_win__full_time_goals']
+        >>> X_fix, _, O_fix = dataloader.extract_fixtures_data()
+        >>> X_fix.shape
+        (20, 15)
+    """
+
+    HOME_ADVANTAGE = 0.25
+    MEAN_GOALS = 1.35
+    STRENGTH_SCALE = 0.25
+    STRENGTH_DRIFT = 0.05
+    MAX_GOALS = 10
+    BOOKMAKERS: ClassVar[dict[str, tuple[float, float, float]]] = {
+        'interwetten': (0.07, 0.03, 0.0),
+        'williamhill': (0.06, 0.03, 0.02),
+        'pinnacle': (0.03, 0.02, 0.0),
+    }
+
+    def __init__(
+        self: Self,
+        param_grid: ParamGrid | None = None,
+        categorical: bool = False,
+        *,
+        n_leagues: int = 5,
+        n_divisions: int = 2,
+        n_seasons: int = 10,
+        n_teams: int = 20,
+        start_year: int = 2000,
+        chunk_size: int = 100_000,
+        random_state: int = 0,
+    ) -> None:
+        super().__init__(param_grid, categorical)
+        self.n_leagues = n_leagues
+        self.n_divisions = n_divisions
+        self.n_seasons = n_seasons
+        self.n_teams = n_teams
+        self.start_year = start_year
+        self.chunk_size = chunk_size
+        self.random_state = random_state
+
+    @classmethod
+    def _get_full_param_grid(cls: type[SyntheticSoccerDataLoader]) -> ParameterGrid:
+        return cls()._get_available_param_grid()
+
+    def _check_generator_params(self: Self) -> Self:
+        """Check the parameters of the generator."""
+        check_scalar(self.n_leagues, 'n_leagues', int, min_val=1)
+        check_scalar(self.n_divisions, 'n_divisions', int, min_val=1)
+        check_scalar(self.n_seasons, 'n_seasons', int, min_val=1)
+        check_scalar(self.n_teams, 'n_teams', int, min_val=2)
+        check_scalar(self.start_year, 'start_year', int, min_val=1)
+        check_scalar(self.chunk_size, 'chunk_size', int, min_val=1)
+        check_scalar(self.random_state, 'random_state', int, min_val=0)
+        return self
+
+    def _get_generator_key(self: Self) -> tuple:
+        """Get a hashable representation of the parameters of the generator."""
+        return self.n_leagues, self.n_divisions, self.n_seasons, self.n_teams, self.start_year, self.random_state
+
+    def _get_leagues(self: Self) -> list[str]:
+        return [f'League {league_ind + 1}' for league_ind in range(self.n_leagues)]
+
+    def _get_teams(self: Self) -> list[str]:
+        return [
+            f'{league} {division} Team {team_ind + 1}'
+            for league in self._get_leagues()
+            for division in range(1, self.n_divisions + 1)
+            for team_ind in range(self.n_teams)
+        ]
+
+    def _get_available_param_grid(self: Self) -> ParameterGrid:
+        self._check_generator_params()
+        return ParameterGrid(
+            {
+                'league': self._get_leagues(),
+                'division': list(range(1, self.n_divisions + 1)),
+                'year': list(range(self.start_year, self.start_year + self.n_seasons)),
+            },
+        )
+
+    def _get_strengths(self: Self, league_ind: int, division_ind: int) -> tuple[np.ndarray, np.ndarray]:
+        """Get the attack and defence strengths of the teams of a division."""
+        rng = np.random.default_rng([self.random_state, 0, league_ind, division_ind])
+        attack, defence = rng.normal(0.0, self.STRENGTH_SCALE, (2, self.n_teams))
+        return attack, defence
+
+    def _get_probabilities(self: Self, home_rates: np.ndarray, away_rates: np.ndarray) -> dict[str, np.ndarray]:
+        """Get the probabilities of the betting markets from the goal rates."""
+        goals = np.arange(self.MAX_GOALS + 1)
+        log_factorials = np.cumsum(np.log(np.maximum(goals, 1)))
+        home_pmf = np.exp(goals * np.log(home_rates[:, None]) - home_rates[:, None] - log_factorials)
+        away_pmf = np.exp(goals * np.log(away_rates[:, None]) - away_rates[:, None] - log_factorials)
+        away_cdf = np.cumsum(away_pmf, axis=1)
+        home_win = (home_pmf[:, 1:] * away_cdf[:, :-1]).sum(axis=1)
+        draw = (home_pmf * away_pmf).sum(axis=1)
+        total_rates = home_rates + away_rates
+        under = np.exp(-total_rates) * (1 + total_rates + total_rates**2 / 2)
+        return {
+            'home_win': home_win,
+            'draw': draw,
+            'away_win': np.clip(1 - home_win - draw, 1e-6, None),
+            f'over_{OVER_UNDER}': 1 - under,
+            f'under_{OVER_UNDER}': under,
+        }
+
+    def _generate_matches(
+        self: Self,
+        rng: np.random.Generator,
+        strengths: tuple[np.ndarray, np.ndarray],
+        home: np.ndarray,
+        away: np.ndarray,
+    ) -> dict[str, np.ndarray]:
+        """Generate the soccer indices, goals and odds of the matches."""
+        attack, defence = (strength + rng.normal(0.0, self.STRENGTH_DRIFT, self.n_teams) for strength in strengths)
+        home_rates = np.exp(np.log(self.MEAN_GOALS) + self.HOME_ADVANTAGE + attack[home] - defence[away])
+        away_rates = np.exp(np.log(self.MEAN_GOALS) + attack[away] - defence[home])
+        soccer_index = 70 + 20 * (attack + defence)
+        matches = {
+            'home_soccer_index': soccer_index[home].round(1),
+            'away_soccer_index': soccer_index[away].round(1),
+            'target__home_team__full_time_goals': rng.poisson(home_rates).astype(float),
+            'target__away_team__full_time_goals': rng.poisson(away_rates).astype(float),
+        }
+        probabilities = self._get_probabilities(home_rates, away_rates)
+        for col, _ in self.SCHEMA:
+            if col.startswith('odds'):
+                _, bookmaker, market, _ = col.split('__')
+                margin, noise, missing = self.BOOKMAKERS[bookmaker]
+                odds = np.exp(rng.normal(0.0, noise, home.size)) / (probabilities[market] * (1 + margin))
+                matches[col] = np.where(rng.random(home.size) < missing, np.nan, np.maximum(odds, 1.01).round(2))
+        return matches
+
+    def _generate_season(self: Self, params: Param) -> dict[str, np.ndarray]:
+        """Generate the matches of a season."""
+        league_ind, division_ind = self._get_leagues().index(params['league']), params['division'] - 1
+        year_ind = params['year'] - self.start_year
+        rng = np.random.default_rng([self.random_state, 1, league_ind, division_ind, year_ind])
+        home, away = np.nonzero(~np.eye(self.n_teams, dtype=bool))
+        order = rng.permutation(home.size)
+        home, away = home[order], away[order]
+        days = np.sort(rng.integers(0, 300, home.size))
+        teams_offset = (league_ind * self.n_divisions + division_ind) * self.n_teams
+        return {
+            'division': np.full(home.size, params['division']),
+            'league': np.full(home.size, league_ind),
+            'date': np.datetime64(f'{params["year"] - 1}-08-01', 'ns') + days.astype('timedelta64[D]'),
+            'year': np.full(home.size, params['year']),
+            'home_team': home + teams_offset,
+            'away_team': away + teams_offset,
+            **self._generate_matches(rng, self._get_strengths(league_ind, division_ind), home, away),
+            'fixtures': np.zeros(home.size, dtype=bool),
+        }
+
+    def _generate_fixtures(self: Self, params: Param) -> dict[str, np.ndarray]:
+        """Generate a round of upcoming matches of a division."""
+        league_ind, division_ind = self._get_leagues().index(params['league']), params['division'] - 1
+        rng = np.random.default_rng([self.random_state, 2, league_ind, division_ind, 0])
+        teams = rng.permutation(self.n_teams)[: self.n_teams // 2 * 2]
+        home, away = teams[::2], teams[1::2]
+        days = rng.integers(1, 8, home.size)
+        teams_offset = (league_ind * self.n_divisions + division_ind) * self.n_teams
+        matches = self._generate_matches(rng, self._get_strengths(league_ind, division_ind), home, away)
+        for col in ('target__home_team__full_time_goals', 'target__away_team__full_time_goals'):
+            matches[col] = np.full(home.size, np.nan)
+        return {
+            'division': np.full(home.size, params['division']),
+            'league': np.full(home.size, league_ind),
+            'date': pd.Timestamp.now().normalize().to_datetime64() + days.astype('timedelta64[D]'),
+            'year': np.full(home.size, params['year']),
+            'home_team': home + teams_offset,
+            'away_team': away + teams_offset,
+            **matches,
+            'fixtures': np.ones(home.size, dtype=bool),
+        }
+
+    def _generate_chunks(self: Self) -> Iterator[list[dict[str, np.ndarray]]]:
+        """Generate the selected seasons and the fixtures in chunks of matches."""
+        seasons_per_chunk = max(1, self.chunk_size // (self.n_teams * (self.n_teams - 1)))
+        params_list = list(self.param_grid_)
+        for ind in range(0, len(params_list), seasons_per_chunk):
+            chunk = params_list[ind : ind + seasons_per_chunk]
+            yield [self._generate_season(params) for params in chunk]
+        latest_year = self.start_year + self.n_seasons - 1
+        yield [
+            self._generate_fixtures(params)
+            for params in self._get_available_param_grid()
+            if params['year'] == latest_year
+        ]
+
+    def _to_frame(self: Self, chunks: Iterator[list[dict[str, np.ndarray]]]) -> pd.DataFrame:
+        """Write the generated chunks of matches to preallocated arrays and convert them to a dataframe.
+
+        The names are categoricals, so that the data do not include any text.
+        """
+        n_rows = len(self.param_grid_) * self.n_teams * (self.n_teams - 1)
+        n_rows += self.n_leagues * self.n_divisions * (self.n_teams // 2)
+        data: dict[str, np.ndarray] = {}
+        start = 0
+        for matches in chunks:
+            for match in matches:
+                end = start + match['fixtures'].size
+                for col, values in match.items():
+                    if col not in data:
+                        data[col] = np.empty(n_rows, dtype=values.dtype)
+                    data[col][start:end] = values
+                start = end
+        leagues, teams = pd.CategoricalDtype(self._get_leagues()), pd.CategoricalDtype(self._get_teams())
+        return pd.DataFrame(
+            {
+                **data,
+                'league': pd.Categorical.from_codes(data['league'], dtype=leagues),
+                'home_team': pd.Categorical.from_codes(data['home_team'], dtype=teams),
+                'away_team': pd.Categorical.from_codes(data['away_team'], dtype=teams),
+            },
+            copy=False,
+        )
+
+    def _get_data_key(self: Self) -> tuple:
+        return type(self), self._get_generator_key(), self._get_param_grid_key()
+
+    def _get_data(self: Self) -> pd.DataFrame:
+        key = self._get_data_key()
+        data = cast('pd.DataFrame | None', DATA_CACHE.get(key))
+        if data is None:
+            data = self._to_frame(self._generate_chunks())
+            DATA_CACHE.put(key, data)
+        return data
@@ -5,31 +5,93 @@
 
 from __future__ import annotations
 
+import re
+import time
 import warnings
-from functools import lru_cache
-from json import loads
-from typing import ClassVar
-
+from collections.abc import Callable, Iterable, Mapping
+from contextlib import suppress
+from functools import lru_cache, partial
+from json import dumps, loads
+from os import PathLike
+from pathlib import Path
+from typing import ClassVar, cast
+
+import aiohttp
 import numpy as np
 import pandas as pd
 from bs4 import BeautifulSoup
+from joblib import effective_n_jobs
 from sklearn.model_selection import ParameterGrid
 from typing_extensions import Self
 
-from ... import FixturesData, ParamGrid, Schema, TrainData
-from .._base import BaseDataLoader
-from ._utils import OUTPUTS, _read_csv, _read_csvs, _read_urls_content
+from ... import BoolData, FixturesData, Indices, Param, ParamGrid, Schema, TrainData
+from .._base import BaseDataLoader, _convert_data_types
+from .._cache import DATA_CACHE
+from ._utils import (
+    ENCODING,
+    OUTPUTS,
+    _extract_outputs,
+    _get_data_home,
+    _HTTPCache,
+    _ParquetStore,
+    _parse_csv,
+    _read_csv,
+    _read_csvs,
+    _read_urls_content,
+    _write_atomically,
+)
 
 MODELLING_URL = 'https://github.com/georgedouzas/sports-betting/tree/data/data/soccer/modelling'
 TRAINING_URL = 'https://raw.githubusercontent.com/georgedouzas/sports-betting/data/data/soccer/modelling/{league}_{division}_{year}.csv'
 FIXTURES_URL = 'https://raw.githubusercontent.com/georgedouzas/sports-betting/data/data/soccer/modelling/fixtures.csv'
+PARAMS_INDEX_FILENAME = 'params.json'
+PARAMS_INDEX_TTL = 24 * 60 * 60
+DATA_SOURCES = ('remote', 'store')
+PARAMS_NAME_PATTERN = re.compile(r'[^_]+_\d+_\d{4}')
+
+
+def _get_params(name: str) -> Param:
+    """Get the parameters of a data file from its name."""
+    league, division, year = name.split('_')
+    league = league.title() if league.lower() != 'usa' else 'USA'
+    return {'league': league, 'division': int(division), 'year': int(year)}
+
+
+def _parse_data(data: pd.DataFrame, data_types: Mapping[str, type]) -> pd.DataFrame:
+    """Parse the dates and cast the data types of the raw data."""
+    try:
+        data['date'] = pd.to_datetime(data['date'], format='%d/%m/%Y')
+    except ValueError:
+        with warnings.catch_warnings():
+            warnings.filterwarnings('ignore', category=UserWarning)
+            data['date'] = pd.to_datetime(data['date'], infer_datetime_format=True)
+    return _convert_data_types(data, data_types)
+
+
+def _find_latest_years(params_list: Iterable[Param]) -> dict[tuple[str, int], int]:
+    """Find the year of the latest season for each league and division."""
+    latest_years: dict[tuple[str, int], int] = {}
+    for params in params_list:
+        key = params['league'], params['division']
+        latest_years[key] = max(params['year'], latest_years.get(key, params['year']))
+    return latest_years
 
 
 class SoccerDataLoader(BaseDataLoader):
     """Dataloader for soccer data.
 
     It downloads historical and fixtures data for various
-    leagues, years and divisions.
+    leagues, years and divisions. The downloaded files are cached in the
+    directory defined by the environment variable `SPORTSBET_DATA_HOME`,
+    with default value `~/sportsbet_data`. The files of past seasons are read
+    directly from the cache, while the rest of the files are revalidated
+    with a conditional request. When the optional dependency `pyarrow` is
+    installed, the parsed data of past seasons are also stored as Parquet files
+    and loaded without parsing the raw files. The index of available parameters
+    is stored in the same directory and it is updated once per day or when the
+    data are refreshed. The data can also be loaded without network access from
+    a local mirror of the remote files, created by the method `mirror`, or from
+    the stored Parquet files.
 
     Read more in the [user guide][user-guide].
 
@@ -41,11 +103,35 @@ class SoccerDataLoader(BaseDataLoader):
             `param_grid` parameter of the scikit-learn's ParameterGrid class.
             The default value `None` corresponds to all parameters.
 
+        categorical:
+            Whether to return the columns of the schema with `object` data type,
+            i.e. the league and teams names, as pandas categoricals. The categories
+            are shared by the training and fixtures data, while new categories are
+            appended to the existing ones, so that the codes of the categories
+            remain stable.
+
+        n_jobs:
+            Number of processes to use when parsing the downloaded files. The
+            default value `None` means parsing the files in threads of the current
+            process, while `-1` means using all processors.
+
+        data_source:
+            The source of the data. The default value `'remote'` downloads the
+            files from the remote repository. The value `'store'` loads only the
+            data of the closed seasons that are stored as Parquet files, while the
+            fixtures are parsed from the cached fixtures file if it exists. Any
+            other value is the path of a local directory that mirrors the
+            remote files, as created by the method `mirror`.
+
     Attributes:
         param_grid_ (ParameterGrid):
             The checked value of parameters grid. It includes all possible parameters if
             `param_grid` is `None`.
 
+        categories_ (dict[str, pd.Index]):
+            The categories of the categorical columns. It is only available when
+            `categorical` is `True`.
+
         dropped_na_cols_ (pd.Index):
             The columns with missing values that are dropped.
 
@@ -55,6 +141,9 @@ class SoccerDataLoader(BaseDataLoader):
         odds_type_ (str | None):
             The checked value of `odds_type`.
 
+        dtype_ (np.dtype | None):
+            The checked value of `dtype`.
+
         input_cols_ (pd.Index):
             The columns of `X_train` and `X_fix`.
 
@@ -161,49 +250,309 @@ class SoccerDataLoader(BaseDataLoader):
     ]
     OUTPUTS = OUTPUTS
 
-    def __init__(self: Self, param_grid: ParamGrid | None = None) -> None:
-        super().__init__(param_grid)
+    def __init__(
+        self: Self,
+        param_grid: ParamGrid | None = None,
+        categorical: bool = False,
+        n_jobs: int | None = None,
+        data_source: str | PathLike = 'remote',
+    ) -> None:
+        super().__init__(param_grid, categorical)
+        self.n_jobs = n_jobs
+        self.data_source = data_source
 
     @classmethod
-    @lru_cache
-    def _get_full_param_grid(cls: type[SoccerDataLoader]) -> ParameterGrid:
+    def _scrape_full_param_grid(cls: type[SoccerDataLoader]) -> list[Param]:
+        """Scrape the parameters of the available files from the remote repository."""
         bsObj = BeautifulSoup(_read_urls_content([MODELLING_URL])[0], features='html.parser')
         element = bsObj.find('script', {'data-target': 'react-app.embeddedData'})
-        param_grid = []
+        params_list = []
         for item in loads(element.text)['payload']['tree']['items']:
             if 'fixtures.csv' not in item['path']:
-                league, division, year = item['name'].replace('.csv', '').split('_')
-                param_grid.append(
-                    {
-                        'league': [league.title() if league.lower() != 'usa' else 'USA'],
-                        'division': [int(division)],
-                        'year': [int(year)],
-                    },
+                params_list.append(_get_params(item['name'].replace('.csv', '')))
+        return params_list
+
+    @classmethod
+    def _update_params_index(cls: type[SoccerDataLoader]) -> list[Param]:
+        """Scrape the parameters and store them in the parameters index."""
+        params_list = cls._scrape_full_param_grid()
+        index = {'timestamp': time.time(), 'param_grid': params_list}
+        with suppress(OSError):
+            _write_atomically(_get_data_home() / PARAMS_INDEX_FILENAME, dumps(index).encode())
+        cls._get_full_param_grid.cache_clear()
+        cls._get_latest_years.cache_clear()
+        return params_list
+
+    @classmethod
+    @lru_cache
+    def _get_full_param_grid(cls: type[SoccerDataLoader]) -> ParameterGrid:
+        """Get the parameters grid from the parameters index.
+
+        The index is stored in the data home directory and it is updated when it
+        is older than `PARAMS_INDEX_TTL` seconds. An outdated index is used when
+        the remote repository is not reachable.
+        """
+        try:
+            index = loads((_get_data_home() / PARAMS_INDEX_FILENAME).read_text())
+        except (OSError, ValueError):
+            index = None
+        if index is not None and time.time() - index['timestamp'] < PARAMS_INDEX_TTL:
+            params_list = index['param_grid']
+        else:
+            try:
+                params_list = cls._update_params_index()
+            except aiohttp.ClientError:
+                if index is None:
+                    raise
+                warnings.warn(
+                    'Parameters index could not be updated. The outdated index is used instead.',
+                    stacklevel=2,
                 )
-        return ParameterGrid(param_grid)
+                params_list = index['param_grid']
+        return ParameterGrid([{name: [value] for name, value in params.items()} for params in params_list])
+
+    @classmethod
+    @lru_cache
+    def _get_latest_years(cls: type[SoccerDataLoader]) -> dict[tuple[str, int], int]:
+        """Get the year of the latest season for each league and division."""
+        return _find_latest_years(cls._get_full_param_grid())
+
+    def _check_data_source(self: Self) -> str:
+        """Check the data source."""
+        if not isinstance(self.data_source, str | PathLike):
+            error_msg = (
+                'Parameter `data_source` should be either `\'remote\'`, `\'store\'` or the path of a directory. '
+                f'Got {type(self.data_source).__name__} instead.'
+            )
+            raise TypeError(error_msg)
+        data_source = str(self.data_source)
+        if data_source not in DATA_SOURCES and not Path(data_source).is_dir():
+            error_msg = (
+                'Parameter `data_source` should be either `\'remote\'`, `\'store\'` or the path of a directory. '
+                f'Got `{data_source}` instead.'
+            )
+            raise ValueError(error_msg)
+        return data_source
+
+    def _get_available_param_grid(self: Self) -> ParameterGrid:
+        """Get the parameters grid of the data source.
+
+        The parameters of a local data source are found from the names of its files, while the files with
+        other names are ignored.
+        """
+        data_source = self._check_data_source()
+        if data_source == 'remote':
+            return self._get_full_param_grid()
+        if data_source == 'store':
+            paths = (_get_data_home() / 'parquet').glob('*.parquet')
+        else:
+            paths = Path(data_source).glob('*.csv')
+        params_list = sorted(
+            (_get_params(path.stem) for path in paths if PARAMS_NAME_PATTERN.fullmatch(path.stem)),
+            key=lambda params: (params['league'], params['division'], params['year']),
+        )
+        return ParameterGrid([{name: [value] for name, value in params.items()} for params in params_list])
+
+    def _get_closed_seasons(self: Self, params_list: list[Param]) -> list[bool]:
+        """Check for each season whether a later season exists for the league and division."""
+        if self._check_data_source() == 'remote':
+            latest_years = self._get_latest_years()
+        else:
+            latest_years = _find_latest_years(self._get_available_param_grid())
+        return [params['year'] < latest_years[(params['league'], params['division'])] for params in params_list]
+
+    def _get_parse_function(self: Self) -> Callable[[pd.DataFrame], pd.DataFrame]:
+        """Get the function that parses the raw data.
+
+        It is a module-level function, so that it is pickled without the dataloader when the data are parsed by a
+        pool of processes.
+        """
+        return partial(_parse_data, data_types=self._get_data_types())
+
+    def _load_training_data(self: Self, params_list: list[Param]) -> list[pd.DataFrame]:
+        """Load the training data of the seasons.
+
+        The target columns that are not used by any output are not parsed, except for the closed seasons that are
+        stored with all their columns.
+        """
+        store = _ParquetStore(_get_data_home() / 'parquet')
+        excluded_cols = self._get_unused_cols()
+        data_source = self._check_data_source()
+        closed_seasons = self._get_closed_seasons(params_list)
+        training_data = [
+            store.get(params, excluded_cols) if closed_season or data_source == 'store' else None
+            for params, closed_season in zip(params_list, closed_seasons, strict=True)
+        ]
+        indices = [ind for ind, data in enumerate(training_data) if data is None]
+        if data_source == 'store' and indices:
+            error_msg = f'The data of the parameters {params_list[indices[0]]} are not stored.'
+            raise FileNotFoundError(error_msg)
+        urls = [self._get_training_location(params_list[ind]) for ind in indices]
+        closed_urls = {url for ind, url in zip(indices, urls, strict=True) if closed_seasons[ind]}
+        csvs = _read_csvs(
+            urls,
+            closed_urls,
+            self._get_data_types(),
+            excluded_cols,
+            self._get_parse_function(),
+            full_urls=closed_urls if store.available else (),
+            n_jobs=effective_n_jobs(self.n_jobs),
+        )
+        for ind, data in zip(indices, csvs, strict=True):
+            if closed_seasons[ind]:
+                store.put(params_list[ind], data)
+            training_data[ind] = data.drop(columns=[col for col in excluded_cols if col in data.columns])
+        return training_data
+
+    def _extract_outputs(self: Self, data: pd.DataFrame) -> BoolData:
+        """Extract the outputs of the output columns into a boolean matrix.
+
+        The outputs of the default `OUTPUTS` are extracted in a single vectorized pass.
+        """
+        outputs = _extract_outputs(data, self.output_cols_) if self.OUTPUTS is OUTPUTS else None
+        return outputs if outputs is not None else super()._extract_outputs(data)
+
+    def _get_counts(self: Self) -> pd.Series | None:
+        """Get the number of non missing values of each column of the training data.
+
+        The counts are available only when all the selected seasons are closed and stored as Parquet files.
+        """
+        store = _ParquetStore(_get_data_home() / 'parquet')
+        data_source = self._check_data_source()
+        counts = []
+        params_list = list(self.param_grid_)
+        closed_seasons = self._get_closed_seasons(params_list)
+        for params, closed_season in zip(params_list, closed_seasons, strict=True):
+            params_counts = store.get_counts(params) if closed_season or data_source == 'store' else None
+            if params_counts is None:
+                return None
+            counts.append(params_counts)
+        return pd.concat(counts, axis=1).fillna(0).sum(axis=1) if counts else None
+
+    def _get_training_location(self: Self, params: Param) -> str:
+        """Get the URL or the local path of the training data file."""
+        url = TRAINING_URL.format(**params)
+        data_source = self._check_data_source()
+        return url if data_source == 'remote' else str(Path(data_source) / url.rsplit('/', 1)[-1])
+
+    def _load_fixtures_data(self: Self) -> pd.DataFrame:
+        """Load the fixtures data."""
+        data_source = self._check_data_source()
+        dtypes, excluded_cols, parse = self._get_data_types(), self._get_unused_cols(), self._get_parse_function()
+        if data_source == 'remote':
+            return _read_csv(FIXTURES_URL, dtypes, excluded_cols, parse)
+        if data_source == 'store':
+            cached = _HTTPCache(_get_data_home() / 'http').get(FIXTURES_URL)
+            return _parse_csv(cached[0], dtypes, excluded_cols, parse) if cached else pd.DataFrame()
+        path = Path(data_source) / FIXTURES_URL.rsplit('/', 1)[-1]
+        return _read_csv(str(path), dtypes, excluded_cols, parse) if path.exists() else pd.DataFrame()
+
+    @staticmethod
+    def _combine_data(
+        training_data: pd.DataFrame,
+        positions: Indices,
+        fixtures_data: pd.DataFrame,
+    ) -> tuple[pd.DataFrame, Indices]:
+        """Combine the training and fixtures data.
+
+        The positions map each row of the data to the season it belongs to, while the fixtures data are placed last.
+        """
+        training_data = training_data.assign(fixtures=False)
+        if fixtures_data.empty:
+            return training_data.reset_index(drop=True), positions
+        data = pd.concat([training_data, fixtures_data.assign(fixtures=True)]).reset_index(drop=True)
+        positions = np.concatenate([positions, np.full(fixtures_data.shape[0], positions.max(initial=-1) + 1)])
+        return data, positions
+
+    def _get_data_key(self: Self) -> tuple:
+        return type(self), self._check_data_source(), self._get_param_grid_key()
 
-    @lru_cache  # noqa: B019
     def _get_data(self: Self) -> pd.DataFrame:
-        urls = [TRAINING_URL.format(**params) for params in self.param_grid_]
-        training_data = pd.concat(_read_csvs(urls))
-        training_data['fixtures'] = False
-        fixtures_data = _read_csv(FIXTURES_URL)
-        fixtures_data['fixtures'] = True
-        data = (pd.concat([training_data, fixtures_data]) if not fixtures_data.empty else training_data).reset_index(
-            drop=True,
+        key = self._get_data_key()
+        cached_data = cast('tuple[pd.DataFrame, Indices, np.ndarray] | None', DATA_CACHE.get(key))
+        if cached_data is None:
+            params_list = list(self.param_grid_)
+            closed_seasons = np.array(self._get_closed_seasons(params_list), dtype=bool)
+            training_data = self._load_training_data(params_list)
+            positions = np.repeat(np.arange(len(params_list)), [data.shape[0] for data in training_data])
+            data, positions = self._combine_data(pd.concat(training_data), positions, self._load_fixtures_data())
+            cached_data = data, positions, closed_seasons
+            DATA_CACHE.put(key, cached_data)
+        return cached_data[0]
+
+    def refresh(self: Self) -> Self:
+        """Refresh the data.
+
+        It updates the index of available parameters and downloads again only
+        the files of the seasons that were not closed when the data were loaded,
+        i.e. the latest season of each league and division at that time, as well
+        as the fixtures file. A season that closed since then is therefore
+        downloaded again in full. The files replace the corresponding parts of
+        the already loaded data, while the data of closed seasons are kept as
+        they are. If the updated index includes new seasons, the data are loaded
+        again on the next extraction. For a local data source, the files are read
+        again from the mirror directory or the store instead.
+
+        Returns:
+            self:
+                The dataloader object.
+        """
+        super().refresh()
+        data_source = self._check_data_source()
+        if data_source == 'remote':
+            self._update_params_index()
+        self._check_param_grid()
+        key = self._get_data_key()
+        cached_data = cast('tuple[pd.DataFrame, Indices, np.ndarray] | None', DATA_CACHE.get(key))
+        if cached_data is None or data_source == 'store':
+            DATA_CACHE.pop(key)
+            return self
+        data, positions, closed_seasons = cached_data
+        params_list = list(self.param_grid_)
+        indices = np.flatnonzero(~closed_seasons).tolist()
+        open_training_data = self._load_training_data([params_list[ind] for ind in indices])
+        mask = np.isin(positions, indices) | data['fixtures'].to_numpy()
+        training_data = pd.concat([data[~mask].drop(columns=['fixtures']), *open_training_data])
+        positions = np.concatenate(
+            [positions[~mask], np.repeat(indices, [data.shape[0] for data in open_training_data])],
         )
-        try:
-            data['date'] = pd.to_datetime(data['date'], format='%d/%m/%Y')
-        except ValueError:
-            with warnings.catch_warnings():
-                warnings.filterwarnings('ignore', category=UserWarning)
-                data['date'] = pd.to_datetime(data['date'], infer_datetime_format=True)
-        return data
+        order = np.argsort(positions, kind='stable')
+        data, positions = self._combine_data(training_data.iloc[order], positions[order], self._load_fixtures_data())
+        DATA_CACHE.put(key, (data, positions, np.array(self._get_closed_seasons(params_list), dtype=bool)))
+        return self
+
+    def mirror(self: Self, path: str | PathLike) -> Self:
+        """Mirror the remote files to a local directory.
+
+        The training files of the parameters selected by `param_grid` and the
+        fixtures file are downloaded from the remote repository and written to
+        the directory. It can then be used as the `data_source` of dataloaders
+        that load the data without network access.
+
+        Args:
+            path:
+                The path of the mirror directory.
+
+        Returns:
+            self:
+                The dataloader object.
+        """
+        self._check_param_grid()
+        params_list = list(self.param_grid_)
+        urls = [TRAINING_URL.format(**params) for params in params_list]
+        closed_urls = {
+            url for url, closed_season in zip(urls, self._get_closed_seasons(params_list), strict=True) if closed_season
+        }
+        urls.append(FIXTURES_URL)
+        for url, content in zip(urls, _read_urls_content(urls, closed_urls), strict=True):
+            _write_atomically(Path(path) / url.rsplit('/', 1)[-1], content.encode(ENCODING))
+        return self
 
     def extract_train_data(
         self: Self,
         drop_na_thres: float = 0.0,
         odds_type: str | None = None,
+        dtype: str | type | None = None,
     ) -> TrainData:
         """Extract the training data.
 
@@ -236,12 +585,17 @@ class SoccerDataLoader(BaseDataLoader):
                 prefixes returned by the method `get_odds_types`. If `odds_type=None`
                 then no odds are returned.
 
+            dtype:
+                The floating point data type of the input and odds data. It is also used
+                for the fixtures data. If `dtype=None` then the data type of the schema is
+                kept, while `dtype='float32'` halves the memory of the data.
+
         Returns:
             (X, Y, O):
                 Each of the components represent the training input data `X`, the
                 multi-output targets `Y` and the corresponding odds `O`, respectively.
         """
-        return super().extract_train_data(drop_na_thres=drop_na_thres, odds_type=odds_type)
+        return super().extract_train_data(drop_na_thres=drop_na_thres, odds_type=odds_type, dtype=dtype)
 
     def extract_fixtures_data(self: Self) -> FixturesData:
         """Extract the fixtures data.
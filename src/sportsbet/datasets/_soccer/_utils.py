@@ -6,12 +6,51 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
 import io
+import json
+import multiprocessing
+import os
+import random
+from collections.abc import Callable, Collection, Coroutine, Mapping, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import suppress
+from hashlib import sha256
+from http import HTTPStatus
+from importlib.util import find_spec
+from pathlib import Path
+from tempfile import NamedTemporaryFile
+from threading import Lock, Thread
+from typing import TYPE_CHECKING, TypeVar
+from urllib.parse import urlsplit
 
 import aiohttp
+import numpy as np
 import pandas as pd
 
+from ... import BoolData, Param
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+T = TypeVar('T')
+
 OVER_UNDER = [1.5, 2.5, 3.5, 4.5]
+RESULTS_COMPARISONS: dict[str, np.ufunc] = {'home_win': np.greater, 'away_win': np.less, 'draw': np.equal}
+
+
+def _get_total_goals(data: pd.DataFrame) -> pd.Series:
+    return data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
+
+
+def _get_over_output(line: float) -> Callable[[pd.DataFrame], pd.Series]:
+    return lambda data: _get_total_goals(data) > line
+
+
+def _get_under_output(line: float) -> Callable[[pd.DataFrame], pd.Series]:
+    return lambda data: _get_total_goals(data) < line
+
+
 OUTPUTS = [
     (
         'output__home_win__full_time_goals',
@@ -25,83 +64,529 @@ OUTPUTS = [
         'output__draw__full_time_goals',
         lambda data: data['target__home_team__full_time_goals'] == data['target__away_team__full_time_goals'],
     ),
-    (
-        f'output__over_{OVER_UNDER[0]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        > OVER_UNDER[0],
-    ),
-    (
-        f'output__over_{OVER_UNDER[1]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        > OVER_UNDER[1],
-    ),
-    (
-        f'output__over_{OVER_UNDER[2]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        > OVER_UNDER[2],
-    ),
-    (
-        f'output__over_{OVER_UNDER[3]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        > OVER_UNDER[3],
-    ),
-    (
-        f'output__under_{OVER_UNDER[0]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        < OVER_UNDER[0],
-    ),
-    (
-        f'output__under_{OVER_UNDER[1]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        < OVER_UNDER[1],
-    ),
-    (
-        f'output__under_{OVER_UNDER[2]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        < OVER_UNDER[2],
-    ),
-    (
-        f'output__under_{OVER_UNDER[3]}__full_time_goals',
-        lambda data: data['target__home_team__full_time_goals'] + data['target__away_team__full_time_goals']
-        < OVER_UNDER[3],
-    ),
+    *[(f'output__over_{line}__full_time_goals', _get_over_output(line)) for line in OVER_UNDER],
+    *[(f'output__under_{line}__full_time_goals', _get_under_output(line)) for line in OVER_UNDER],
 ]
+
+
+def _extract_outputs(data: pd.DataFrame, output_cols: Sequence[str]) -> BoolData | None:
+    """Extract the outputs of the results and over/under markets.
+
+    The goals difference and total goals of each target are calculated once. The results outputs are compared to
+    the goals difference, while the outputs of all over/under lines are compared to the total goals in a single
+    broadcasted comparison. It returns `None` when an output is not a results or over/under market.
+    """
+    outputs = np.empty((data.shape[0], len(output_cols)), dtype=bool)
+    markets_targets = [col.split('__')[1:] for col in output_cols]
+    for target in dict.fromkeys(target for _, target in markets_targets):
+        cols = [f'target__{team}_team__{target}' for team in ('home', 'away')]
+        if not set(cols).issubset(data.columns):
+            return None
+        home_goals, away_goals = (data[col].to_numpy() for col in cols)
+        goals_difference, total_goals = home_goals - away_goals, home_goals + away_goals
+        lines: dict[str, tuple[list[int], list[float]]] = {'over': ([], []), 'under': ([], [])}
+        for ind, (market, market_target) in enumerate(markets_targets):
+            if market_target != target:
+                continue
+            if market in RESULTS_COMPARISONS:
+                outputs[:, ind] = RESULTS_COMPARISONS[market](goals_difference, 0)
+                continue
+            direction, _, line = market.partition('_')
+            if direction not in lines:
+                return None
+            try:
+                lines[direction][1].append(float(line))
+            except ValueError:
+                return None
+            lines[direction][0].append(ind)
+        for direction, comparison in (('over', np.greater), ('under', np.less)):
+            indices, values = lines[direction]
+            if indices:
+                outputs[:, indices] = comparison(total_goals.reshape(-1, 1), np.array(values))
+    return outputs
+
+
 CONNECTIONS_LIMIT = 20
+CONNECTIONS_PER_HOST_LIMIT = 10
+KEEPALIVE_TIMEOUT = 30.0
+RETRIES = 3
+RETRY_BACKOFF = 0.5
+RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    },
+)
+PARSERS_LIMIT = min(CONNECTIONS_LIMIT, os.cpu_count() or 1)
+DATA_HOME_ENV = 'SPORTSBET_DATA_HOME'
+ENCODING = 'ISO-8859-1'
+PYARROW_AVAILABLE = find_spec('pyarrow') is not None
+
+
+def _get_data_home() -> Path:
+    """Get the directory of the locally stored data."""
+    return Path(os.environ.get(DATA_HOME_ENV, Path.home() / 'sportsbet_data')).expanduser()
+
+
+def _replace_none(data: pd.DataFrame) -> pd.DataFrame:
+    """Replace the missing values of the object columns, converted from Arrow nulls, with `np.nan`."""
+    object_cols = data.select_dtypes(include=object).columns
+    data[object_cols] = data[object_cols].where(data[object_cols].notna(), np.nan)
+    return data
+
+
+def _write_atomically(path: Path, content: bytes) -> None:
+    """Write the content to a file without exposing partially written files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with NamedTemporaryFile(dir=path.parent, prefix=f'{path.name}.', suffix='.tmp', delete=False) as file:
+        file.write(content)
+    tmp_path = Path(file.name)
+    try:
+        tmp_path.replace(path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+class _HTTPCache:
+    """Persistent cache of the URLs content.
+
+    The raw content of each URL is stored on disk together with the `ETag` and `Last-Modified` headers of the
+    response, so that it can be revalidated with a conditional request. The content of URLs that was stored or
+    revalidated after they were closed, i.e. their content is not expected to change, is served directly from disk.
+    """
+
+    def __init__(self: _HTTPCache, path: Path) -> None:
+        self.path = path
+
+    def _get_paths(self: _HTTPCache, url: str) -> tuple[Path, Path]:
+        key = sha256(url.encode()).hexdigest()
+        return self.path / f'{key}.content', self.path / f'{key}.json'
+
+    def get(self: _HTTPCache, url: str) -> tuple[bytes, dict] | None:
+        """Get the content and the metadata of the URL."""
+        content_path, metadata_path = self._get_paths(url)
+        try:
+            content = content_path.read_bytes()
+            metadata = json.loads(metadata_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return content, metadata
+
+    def put(self: _HTTPCache, url: str, content: bytes, metadata: dict) -> None:
+        """Store the content and the metadata of the URL."""
+        content_path, metadata_path = self._get_paths(url)
+        try:
+            _write_atomically(content_path, content)
+            _write_atomically(metadata_path, json.dumps({'url': url, **metadata}).encode())
+        except OSError:
+            return
+
+
+class _ParquetStore:
+    """Persistent store of the parsed data.
+
+    Each partition of the data is stored as a typed Parquet file, keyed by the league, division and year. It requires
+    the optional dependency `pyarrow`, otherwise nothing is stored.
+    """
+
+    def __init__(self: _ParquetStore, path: Path) -> None:
+        self.path = path
+        self.available = PYARROW_AVAILABLE
+
+    def _get_path(self: _ParquetStore, params: Param) -> Path:
+        return self.path / f'{params["league"]}_{params["division"]}_{params["year"]}.parquet'
+
+    def get(self: _ParquetStore, params: Param, excluded_cols: Collection[str] = ()) -> pd.DataFrame | None:
+        """Get the data of the partition without the columns of `excluded_cols`."""
+        if not self.available:
+            return None
+        from pyarrow.parquet import read_schema  # noqa: PLC0415
+
+        path = self._get_path(params)
+        try:
+            names = read_schema(path).names
+            data = pd.read_parquet(path, columns=[name for name in names if name not in excluded_cols])
+        except (OSError, ValueError):
+            return None
+        return _replace_none(data)
+
+    def get_counts(self: _ParquetStore, params: Param) -> pd.Series | None:
+        """Get the number of non missing values of each column of the partition.
 
+        The counts are calculated from the statistics of the Parquet file without reading the data.
+        """
+        if not self.available:
+            return None
+        from pyarrow.parquet import read_metadata  # noqa: PLC0415
 
-async def _read_url_content_async(client: aiohttp.ClientSession, url: str) -> str:
-    """Read asynchronously the URL content."""
-    async with client.get(url) as response:
-        with io.StringIO(await response.text(encoding='ISO-8859-1')) as text_io:
-            return text_io.getvalue()
+        try:
+            metadata = read_metadata(self._get_path(params))
+        except (OSError, ValueError):
+            return None
+        counts: dict[str, int] = {}
+        for row_group_ind in range(metadata.num_row_groups):
+            row_group = metadata.row_group(row_group_ind)
+            for col_ind in range(row_group.num_columns):
+                column = row_group.column(col_ind)
+                if column.statistics is None or not column.statistics.has_null_count:
+                    return None
+                count = row_group.num_rows - column.statistics.null_count
+                counts[column.path_in_schema] = counts.get(column.path_in_schema, 0) + count
+        return pd.Series(counts, dtype=int)
 
+    def put(self: _ParquetStore, params: Param, data: pd.DataFrame) -> None:
+        """Store the data of the partition."""
+        if not self.available:
+            return
+        try:
+            _write_atomically(self._get_path(params), data.reset_index(drop=True).to_parquet(index=False))
+        except (OSError, ValueError):
+            return
 
-async def _read_urls_content_async(urls: list[str]) -> list[str]:
+
+class DownloadError(aiohttp.ClientError):
+    """Error raised when some of the URLs can not be downloaded.
+
+    The URLs are downloaded concurrently and each failed download is retried, therefore the error is raised after
+    all the downloads are completed and it reports every URL that failed.
+
+    Args:
+        errors:
+            The errors of the failed downloads, keyed by the URL.
+
+        n_urls:
+            The total number of the downloaded URLs.
+    """
+
+    def __init__(self: DownloadError, errors: Mapping[str, BaseException], n_urls: int) -> None:
+        self.errors = dict(errors)
+        failures = ', '.join(f'{url} ({error!r})' for url, error in self.errors.items())
+        super().__init__(f'Failed to download {len(self.errors)} of {n_urls} URLs: {failures}')
+
+
+class _HTTPClient:
+    """Long-lived pooled HTTP client.
+
+    The client owns an event loop that runs in a background thread and an `aiohttp` session that keeps the
+    connections alive between calls, so that the parameters index, the training data and the fixtures reuse the
+    same connections. Coroutines are submitted to the event loop of the client, therefore the client can be used
+    even when the caller runs its own event loop.
+    """
+
+    def __init__(self: _HTTPClient) -> None:
+        self._reset()
+
+    def _reset(self: _HTTPClient) -> None:
+        self._lock = Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._session: aiohttp.ClientSession | None = None
+
+    def _get_loop(self: _HTTPClient) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                Thread(target=self._loop.run_forever, name='sportsbet-http-client', daemon=True).start()
+            return self._loop
+
+    def get_session(self: _HTTPClient) -> aiohttp.ClientSession:
+        """Get the session of the client. It is called from the event loop of the client."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                raise_for_status=True,
+                connector=aiohttp.TCPConnector(
+                    limit=CONNECTIONS_LIMIT,
+                    limit_per_host=CONNECTIONS_PER_HOST_LIMIT,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                ),
+            )
+        return self._session
+
+    def run(self: _HTTPClient, coro: Coroutine[object, object, T]) -> T:
+        """Run the coroutine on the event loop of the client and wait for its result."""
+        return asyncio.run_coroutine_threadsafe(coro, self._get_loop()).result()
+
+    async def _close_session(self: _HTTPClient) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def close(self: _HTTPClient) -> None:
+        """Close the session and stop the event loop of the client."""
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is None or loop.is_closed():
+            return
+        with suppress(RuntimeError):
+            asyncio.run_coroutine_threadsafe(self._close_session(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+
+
+HTTP_CLIENT = _HTTPClient()
+atexit.register(HTTP_CLIENT.close)
+os.register_at_fork(after_in_child=HTTP_CLIENT._reset)
+
+
+def _is_retryable(error: BaseException) -> bool:
+    """Check whether the failed request can be retried."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, aiohttp.ClientError | asyncio.TimeoutError)
+
+
+def _get_backoff(attempt: int) -> float:
+    """Get the jittered exponential delay before retrying the request."""
+    return RETRY_BACKOFF * 2**attempt * random.uniform(0.5, 1.5)  # noqa: S311
+
+
+def _is_url(url: str) -> bool:
+    """Check whether the location is a remote URL or the path of a local file."""
+    return urlsplit(url).scheme in ('http', 'https')
+
+
+def _check_downloads(urls: Sequence[str], results: Sequence[T | BaseException]) -> list[T]:
+    """Check the results of the concurrent downloads and report all the failed ones."""
+    errors = {url: result for url, result in zip(urls, results, strict=True) if isinstance(result, BaseException)}
+    for error in errors.values():
+        if not isinstance(error, aiohttp.ClientError | asyncio.TimeoutError):
+            raise error
+    if errors:
+        raise DownloadError(errors, len(urls))
+    return list(results)  # type: ignore[arg-type]
+
+
+async def _request_url_content_async(
+    client: aiohttp.ClientSession,
+    url: str,
+    headers: Mapping[str, str],
+    cached: tuple[bytes, dict] | None,
+    closed: bool,
+) -> tuple[bytes, dict]:
+    """Request asynchronously the raw URL content and its metadata."""
+    async with client.get(url, headers=headers) as response:
+        if cached is not None and response.status == HTTPStatus.NOT_MODIFIED:
+            return cached[0], {**cached[1], 'closed': closed}
+        content = await response.read()
+        metadata = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'closed': closed,
+        }
+        return content, metadata
+
+
+async def _read_url_content_async(
+    client: aiohttp.ClientSession,
+    url: str,
+    cache: _HTTPCache,
+    closed: bool,
+) -> bytes:
+    """Read asynchronously the raw URL content.
+
+    The request is retried with a jittered exponential backoff when it fails with a connection error, a timeout
+    or a transient status.
+    """
+    cached = cache.get(url)
+    if cached is not None and closed and cached[1].get('closed'):
+        return cached[0]
+    headers = {}
+    if cached is not None and cached[1].get('etag') is not None:
+        headers['If-None-Match'] = cached[1]['etag']
+    if cached is not None and cached[1].get('last_modified') is not None:
+        headers['If-Modified-Since'] = cached[1]['last_modified']
+    for attempt in range(RETRIES + 1):
+        try:
+            content, metadata = await _request_url_content_async(client, url, headers, cached, closed)
+            break
+        except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+            if attempt == RETRIES or not _is_retryable(error):
+                raise
+        await asyncio.sleep(_get_backoff(attempt))
+    if cached is None or cached[1] != metadata or content is not cached[0]:
+        cache.put(url, content, metadata)
+    return content
+
+
+async def _read_urls_content_async(urls: list[str], closed_urls: Collection[str]) -> list[str]:
     """Read asynchronously the URLs content."""
-    async with aiohttp.ClientSession(
-        raise_for_status=True,
-        connector=aiohttp.TCPConnector(limit=CONNECTIONS_LIMIT),
-    ) as client:
-        futures = [_read_url_content_async(client, url) for url in urls]
-        return await asyncio.gather(*futures)
+    cache = _HTTPCache(_get_data_home() / 'http')
+    client = HTTP_CLIENT.get_session()
+    futures = [_read_url_content_async(client, url, cache, url in closed_urls) for url in urls]
+    contents = _check_downloads(urls, await asyncio.gather(*futures, return_exceptions=True))
+    return [content.decode(ENCODING) for content in contents]
+
+
+def _read_urls_content(urls: list[str], closed_urls: Collection[str] = ()) -> list[str]:
+    """Read the URLs content.
+
+    The content of the URLs is cached on disk. The cached content of URLs that are included in `closed_urls` is
+    revalidated once with a conditional request and then returned without any request, while the rest of the URLs
+    are always revalidated. The URLs are downloaded by the pooled client `HTTP_CLIENT` and a `DownloadError` is
+    raised when some of them can not be downloaded.
+    """
+    return HTTP_CLIENT.run(_read_urls_content_async(urls, closed_urls))
+
+
+def _read_csv_content(content: bytes, excluded_cols: Collection[str] = ()) -> pd.DataFrame:
+    """Parse the CSV content and skip the malformed lines."""
+    names = pd.read_csv(io.BytesIO(content), nrows=0, encoding=ENCODING).columns.to_list()
+    return pd.read_csv(
+        io.BytesIO(content),
+        names=names,
+        skiprows=1,
+        usecols=[name for name in names if name not in excluded_cols],
+        encoding=ENCODING,
+        on_bad_lines='skip',
+    )
+
+
+def _read_csv_content_arrow(
+    content: bytes,
+    dtypes: Mapping[str, type],
+    excluded_cols: Collection[str] = (),
+) -> pd.DataFrame:
+    """Parse the CSV content with the multithreaded reader of `pyarrow`."""
+    import pyarrow as pa  # noqa: PLC0415
+    from pyarrow import csv  # noqa: PLC0415
+
+    arrow_types = {float: pa.float64(), np.int64: pa.int64(), object: pa.string(), np.datetime64: pa.string()}
+    convert_options = csv.ConvertOptions(
+        column_types={col: arrow_types[dtype] for col, dtype in dtypes.items() if dtype in arrow_types},
+        null_values=[*csv.ConvertOptions().null_values, '-'],
+        strings_can_be_null=True,
+    )
+    if excluded_cols:
+        names = pd.read_csv(io.BytesIO(content), nrows=0, encoding=ENCODING).columns
+        convert_options.include_columns = [name for name in names if name not in excluded_cols]
+    data = csv.read_csv(
+        pa.BufferReader(content),
+        read_options=csv.ReadOptions(encoding=ENCODING),
+        convert_options=convert_options,
+    ).to_pandas()
+    return _replace_none(data)
+
+
+def _parse_csv(
+    content: bytes,
+    dtypes: Mapping[str, type] | None,
+    excluded_cols: Collection[str],
+    parse: Callable[[pd.DataFrame], pd.DataFrame] | None,
+) -> pd.DataFrame:
+    """Parse the CSV content.
+
+    The content is parsed in a single pass with the data types of the `dtypes` mapping when `pyarrow` is installed.
+    Otherwise or when the content is malformed, it is parsed by `pandas` and the malformed lines are skipped. The
+    columns of `excluded_cols` are not parsed.
+    """
+    csv = None
+    if dtypes is not None and PYARROW_AVAILABLE:
+        from pyarrow import ArrowInvalid  # noqa: PLC0415
+
+        with suppress(ArrowInvalid):
+            csv = _read_csv_content_arrow(content, dtypes, excluded_cols)
+    if csv is None:
+        csv = _read_csv_content(content, excluded_cols)
+    return parse(csv) if parse is not None else csv
+
+
+def _parse_csv_to_arrow(
+    content: bytes,
+    dtypes: Mapping[str, type] | None,
+    excluded_cols: Collection[str],
+    parse: Callable[[pd.DataFrame], pd.DataFrame] | None,
+) -> pa.Buffer:
+    """Parse the CSV content and serialize it to an Arrow IPC buffer."""
+    import pyarrow as pa  # noqa: PLC0415
+
+    table = pa.Table.from_pandas(_parse_csv(content, dtypes, excluded_cols, parse), preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue()
+
+
+def _read_arrow(buffer: pa.Buffer) -> pd.DataFrame:
+    """Read the CSV from an Arrow IPC buffer."""
+    import pyarrow as pa  # noqa: PLC0415
+
+    return _replace_none(pa.ipc.open_stream(buffer).read_all().to_pandas())
+
+
+async def _read_csvs_async(
+    urls: list[str],
+    closed_urls: Collection[str],
+    dtypes: Mapping[str, type] | None,
+    excluded_cols: Collection[str],
+    parse: Callable[[pd.DataFrame], pd.DataFrame] | None,
+    *,
+    full_urls: Collection[str],
+    executor: Executor,
+    arrow: bool,
+) -> list[pd.DataFrame]:
+    """Read asynchronously the CSVs and parse them with the executor."""
+    cache = _HTTPCache(_get_data_home() / 'http')
+    loop = asyncio.get_running_loop()
+    # Bound the number of downloaded CSVs that are not parsed yet
+    semaphore = asyncio.Semaphore(CONNECTIONS_LIMIT)
+    client = HTTP_CLIENT.get_session()
 
+    async def read_csv(url: str) -> pd.DataFrame:
+        async with semaphore:
+            if _is_url(url):
+                content = await _read_url_content_async(client, url, cache, url in closed_urls)
+            else:
+                content = await asyncio.to_thread(Path(url).read_bytes)
+            args = content, dtypes, () if url in full_urls else excluded_cols, parse
+            if arrow:
+                return _read_arrow(await loop.run_in_executor(executor, _parse_csv_to_arrow, *args))
+            return await loop.run_in_executor(executor, _parse_csv, *args)
 
-def _read_urls_content(urls: list[str]) -> list[str]:
-    """Read the URLs content."""
-    return asyncio.run(_read_urls_content_async(urls))
+    return _check_downloads(urls, await asyncio.gather(*[read_csv(url) for url in urls], return_exceptions=True))
 
 
-def _read_csvs(urls: list[str]) -> list[pd.DataFrame]:
-    """Read the CSVs."""
-    urls_content = _read_urls_content(urls)
-    csvs = []
-    for content in urls_content:
-        names = pd.read_csv(io.StringIO(content), nrows=0, encoding='ISO-8859-1').columns.to_list()
-        csv = pd.read_csv(io.StringIO(content), names=names, skiprows=1, encoding='ISO-8859-1', on_bad_lines='skip')
-        csvs.append(csv)
-    return csvs
+def _read_csvs(
+    urls: list[str],
+    closed_urls: Collection[str] = (),
+    dtypes: Mapping[str, type] | None = None,
+    excluded_cols: Collection[str] = (),
+    parse: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+    *,
+    full_urls: Collection[str] = (),
+    n_jobs: int = 1,
+) -> list[pd.DataFrame]:
+    """Read and parse concurrently the CSVs of the URLs or local paths in their order."""
+    if not urls:
+        return []
+    # The pool is created in the calling thread, so that it does not block the event loop of `HTTP_CLIENT`, and its
+    # processes are spawned, since forking the running threads of the client may deadlock
+    executor: Executor = (
+        ProcessPoolExecutor(max_workers=min(n_jobs, len(urls)), mp_context=multiprocessing.get_context('spawn'))
+        if n_jobs > 1
+        else ThreadPoolExecutor(PARSERS_LIMIT)
+    )
+    with executor:
+        coro = _read_csvs_async(
+            urls,
+            closed_urls,
+            dtypes,
+            excluded_cols,
+            parse,
+            full_urls=full_urls,
+            executor=executor,
+            # The processes return Arrow IPC buffers that are cheaper to transfer than pickled dataframes
+            arrow=n_jobs > 1 and PYARROW_AVAILABLE,
+        )
+        return HTTP_CLIENT.run(coro)
 
 
-def _read_csv(url: str) -> pd.DataFrame:
+def _read_csv(
+    url: str,
+    dtypes: Mapping[str, type] | None = None,
+    excluded_cols: Collection[str] = (),
+    parse: Callable[[pd.DataFrame], pd.DataFrame] | None = None,
+) -> pd.DataFrame:
     """Read the CSV."""
-    return _read_csvs([url])[0]
+    return _read_csvs([url], dtypes=dtypes, excluded_cols=excluded_cols, parse=parse)[0]
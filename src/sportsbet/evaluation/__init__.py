@@ -4,11 +4,12 @@ from __future__ import annotations
 
 from ._base import BaseBettor, load_bettor, save_bettor
 from ._classifier import ClassifierBettor
-from ._model_selection import BettorGridSearchCV, backtest, value_bet_backtest
+from ._model_selection import BettingScorer, BettorGridSearchCV, backtest, value_bet_backtest
 from ._rules import OddsComparisonBettor
 
 __all__: list[str] = [
     'BaseBettor',
+    'BettingScorer',
     'BettorGridSearchCV',
     'ClassifierBettor',
     'OddsComparisonBettor',
@@ -5,9 +5,13 @@
 
 from __future__ import annotations
 
+import weakref
 from abc import ABCMeta, abstractmethod
+from collections.abc import Callable, Hashable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import ClassVar
+from typing import ClassVar, NamedTuple, TypeVar
 
 import cloudpickle
 import numpy as np
@@ -21,6 +25,115 @@ from typing_extensions import Self
 
 from .. import BoolData, Data
 
+T = TypeVar('T')
+
+COLUMNS_CACHE_SIZE = 256
+_COLUMNS_CACHE: dict[tuple[int, Hashable], tuple[weakref.ref, object]] = {}
+_TRUSTED_COLUMNS: ContextVar[tuple[pd.Index, ...]] = ContextVar('trusted_columns', default=())
+
+
+@contextmanager
+def _trusted_data(*data: pd.DataFrame | None) -> Iterator[None]:
+    """Trust the validated data inside the context.
+
+    The data and their row slices, which share the same columns, skip the checks of their length, type and
+    feature names when they are passed to the bettors inside the context.
+    """
+    token = _TRUSTED_COLUMNS.set((*_TRUSTED_COLUMNS.get(), *(df.columns for df in data if df is not None)))
+    try:
+        yield
+    finally:
+        _TRUSTED_COLUMNS.reset(token)
+
+
+def _is_trusted(*data: object) -> bool:
+    """Check whether the data are trusted."""
+    trusted_columns = _TRUSTED_COLUMNS.get()
+    return all(any(getattr(df, 'columns', None) is columns for columns in trusted_columns) for df in data)
+
+
+def _get_columns_cached(columns: pd.Index, key: Hashable, resolve: Callable[[pd.Index], T]) -> T:
+    """Get the cached resolution of the columns.
+
+    The resolutions are keyed by the identity of the columns, since they are immutable and they are shared by the
+    slices of the data, and they are removed when the columns are garbage collected.
+    """
+    cache_key = id(columns), key
+    cached = _COLUMNS_CACHE.get(cache_key)
+    if cached is not None and cached[0]() is columns:
+        return cached[1]  # type: ignore[return-value]
+    value = resolve(columns)
+    if len(_COLUMNS_CACHE) >= COLUMNS_CACHE_SIZE:
+        _COLUMNS_CACHE.pop(next(iter(_COLUMNS_CACHE)), None)
+    _COLUMNS_CACHE[cache_key] = weakref.ref(columns, lambda _: _COLUMNS_CACHE.pop(cache_key, None)), value
+    return value
+
+
+def _resolve_output_columns(columns: pd.Index) -> tuple[str | None, list[str]]:
+    """Resolve the betting markets of the output data columns or the error of their names."""
+    Y_cols = [col.split('__') for col in columns]
+    if {len(tokens) for tokens in Y_cols} != {3}:
+        error_msg = (
+            "Output data column names should follow a naming "
+            "convention of the form `f'output__{betting_market_prefix}__{betting_market_target}'`"
+        )
+        return error_msg, []
+    Y_prefix, *Y_betting_markets_tokens = zip(*Y_cols, strict=True)
+    if set(Y_prefix) != {'output'}:
+        return 'Prefixes of output data column names should be equal to `output`.', []
+    return None, ['__'.join(tokens) for tokens in zip(*Y_betting_markets_tokens, strict=True)]
+
+
+def _resolve_odds_columns(columns: pd.Index) -> tuple[str | None, list[str]]:
+    """Resolve the betting markets of the odds data columns or the error of their names."""
+    O_cols = [col.split('__') for col in columns]
+    if {len(tokens) for tokens in O_cols} != {4}:
+        error_msg = (
+            "Odds data column names should follow a naming "
+            "convention of the form `f'odds__{bookmaker}__{betting_market_prefix}__{betting_market_target}'`"
+        )
+        return error_msg, []
+    O_prefix, O_bookmakers, *O_betting_markets_tokens = zip(*O_cols, strict=True)
+    if set(O_prefix) != {'odds'}:
+        return 'Prefixes of odds data column names should be equal to `odds`.', []
+    if len(set(O_bookmakers)) != 1:
+        return 'Bookmakers of odds data column names should be unique.', []
+    return None, ['__'.join(tokens) for tokens in zip(*O_betting_markets_tokens, strict=True)]
+
+
+def _get_daily_returns(dates: pd.DatetimeIndex, returns: np.ndarray) -> np.ndarray:
+    """Aggregate the returns into daily returns.
+
+    The returns of each date that is a whole number of days after the first date are summed, the returns of the rest
+    of the dates are ignored and the days without returns have zero returns.
+    """
+    if dates.size == 0:
+        return np.zeros(0, dtype=float)
+    day_offsets, remainders = np.divmod((dates - dates.min()).to_numpy(), np.timedelta64(1, 'D'))
+    n_days = day_offsets.max() + 1
+    mask = remainders == np.timedelta64(0)
+    return np.bincount(day_offsets[mask], weights=returns[mask].astype(float), minlength=n_days)
+
+
+def _get_sharpe_ratio(daily_returns: np.ndarray) -> float:
+    """Get the annual sharpe ratio of the daily returns."""
+    returns_mean = daily_returns.mean() if daily_returns.size > 0 else 0.0
+    returns_std = daily_returns.std(ddof=1) if daily_returns.size > 1 else np.nan
+    if returns_std == 0 or np.isnan(returns_std):
+        max_sharpe_ratio = 100.0
+        return max_sharpe_ratio if returns_mean > 0 else -max_sharpe_ratio
+    return np.sqrt(365) * returns_mean / returns_std
+
+
+class _MarketLayout(NamedTuple):
+    """Compiled layout of the betting markets."""
+
+    indices: np.ndarray
+    starts: np.ndarray
+    groups: np.ndarray
+    ranks: np.ndarray
+    complete_groups: list[np.ndarray]
+
 
 class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABCMeta):
     """The base class for bettors.
@@ -48,10 +161,32 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
         self.init_cash = init_cash
         self.stake = stake
 
-    def _get_feature_names_odds(self: Self, O: pd.DataFrame) -> NDArray[Shape['*'], String]:  # noqa: F722
-        return np.array(
-            [col for col in O.columns if '__'.join(col.split('__')[2:]) in self.betting_markets_],
+    def _get_odds_positions(self: Self, O: pd.DataFrame) -> np.ndarray:
+        """Get the positions of the odds columns of the selected betting markets."""
+        betting_markets = set(self.betting_markets_)
+        return _get_columns_cached(
+            O.columns,
+            ('odds', *self.betting_markets_),
+            lambda columns: np.array(
+                [ind for ind, col in enumerate(columns) if '__'.join(col.split('__')[2:]) in betting_markets],
+                dtype=int,
+            ),
+        )
+
+    def _get_output_positions(self: Self, Y: pd.DataFrame) -> np.ndarray:
+        """Get the positions of the output columns of the selected betting markets."""
+        positions = _get_columns_cached(
+            Y.columns,
+            ('output', *self.feature_names_out_),
+            lambda columns: columns.get_indexer(self.feature_names_out_),
         )
+        if (positions < 0).any():
+            error_msg = f'{self.feature_names_out_[positions < 0].tolist()} not in index'
+            raise KeyError(error_msg)
+        return positions
+
+    def _get_feature_names_odds(self: Self, O: pd.DataFrame) -> NDArray[Shape['*'], String]:  # noqa: F722
+        return np.array(O.columns[self._get_odds_positions(O)].tolist())
 
     def _check(
         self: Self,
@@ -101,14 +236,51 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
         )
         self.stake_ = float(stake)
 
+        # Compile the layout of complementary events
+        self._market_layout = self._compile_market_layout()
+
         # Check features
         _check_feature_names(self, X, reset=True)
-        self.feature_names_out_ = np.array(
-            [col for col in Y.columns if '__'.join(col.split('__')[1:]) in self.betting_markets_],
-        )
+        self.feature_names_out_ = Y.columns[np.isin(Y_betting_markets, self.betting_markets_)].to_numpy(dtype=str)
         if O is not None:
             self.feature_names_odds_ = self._get_feature_names_odds(O)
 
+    def _compile_market_layout(self: Self) -> _MarketLayout:
+        """Compile the grouping of the betting markets into complementary events.
+
+        It returns the positions of the betting markets that belong to any complementary events, ordered by group,
+        the start of each group, the group of each position, the rank of each position within its group and the
+        positions of the groups that include all their complementary events.
+        """
+        groups = [np.flatnonzero(np.isin(self.betting_markets_, events)) for events in self.COMPLEMENTARY_EVENTS]
+        sizes = np.array([group.size for group in groups if group.size > 0], dtype=int)
+        indices = np.concatenate(groups).astype(int)
+        starts = np.cumsum(sizes) - sizes
+        ranks = np.arange(indices.size) - np.repeat(starts, sizes)
+        complete_groups = [
+            group
+            for group, events in zip(groups, self.COMPLEMENTARY_EVENTS, strict=True)
+            if set(self.betting_markets_).issuperset(events)
+        ]
+        return _MarketLayout(indices, starts, np.repeat(np.arange(sizes.size), sizes), ranks, complete_groups)
+
+    def _get_market_layout(self: Self) -> _MarketLayout:
+        """Get the compiled layout of complementary events."""
+        market_layout = getattr(self, '_market_layout', None)
+        if market_layout is None:
+            market_layout = self._market_layout = self._compile_market_layout()
+        return market_layout
+
+    def _bet(self: Self, Y_proba_pred: Data, O: Data) -> BoolData:
+        """Select the value bets with the maximum estimated return of each group of complementary events."""
+        indices, starts, groups, ranks, _ = self._get_market_layout()
+        if indices.size == 0:
+            return np.zeros((Y_proba_pred.shape[0], 0), dtype=bool)
+        products = O[:, indices] * Y_proba_pred[:, indices]
+        estimated_returns = np.nan_to_num(products - 1) + ranks * self.TOL
+        max_estimated_returns = np.maximum.reduceat(estimated_returns, starts, axis=1)
+        return (products > 1) & (estimated_returns == max_estimated_returns[:, groups])
+
     @property
     def classes_(self: Self) -> list:
         try:
@@ -124,30 +296,23 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
         Y: pd.DataFrame,
     ) -> tuple[pd.DataFrame, pd.DataFrame, list[str]]:
 
-        # Check number of samples
-        check_consistent_length(X, Y)
+        if not _is_trusted(X, Y):
 
-        # Check data type
-        if not isinstance(X, pd.DataFrame) or not isinstance(X.index, pd.DatetimeIndex):
-            error_msg = 'Input data `X` should be pandas dataframe with a date index.'
-            raise TypeError(error_msg)
-        if not isinstance(Y, pd.DataFrame):
-            error_msg = 'Output data `Y` should be pandas dataframe.'
-            raise TypeError(error_msg)
+            # Check number of samples
+            check_consistent_length(X, Y)
+
+            # Check data type
+            if not isinstance(X, pd.DataFrame) or not isinstance(X.index, pd.DatetimeIndex):
+                error_msg = 'Input data `X` should be pandas dataframe with a date index.'
+                raise TypeError(error_msg)
+            if not isinstance(Y, pd.DataFrame):
+                error_msg = 'Output data `Y` should be pandas dataframe.'
+                raise TypeError(error_msg)
 
         # Check Y columns
-        Y_cols = [col.split('__') for col in Y.columns]
-        error_msg = (
-            "Output data column names should follow a naming "
-            "convention of the form `f'output__{betting_market_prefix}__{betting_market_target}'`"
-        )
-        if {len(tokens) for tokens in Y_cols} != {3}:
-            raise ValueError(error_msg)
-        Y_prefix, *Y_betting_markets_tokens = zip(*Y_cols, strict=True)
-        Y_betting_markets = ['__'.join(tokens) for tokens in zip(*Y_betting_markets_tokens, strict=True)]
-        if set(Y_prefix) != {'output'}:
-            error_msg = 'Prefixes of output data column names should be equal to `output`.'
-            raise ValueError(error_msg)
+        columns_error_msg, Y_betting_markets = _get_columns_cached(Y.columns, 'output', _resolve_output_columns)
+        if columns_error_msg is not None:
+            raise ValueError(columns_error_msg)
 
         return X, Y, Y_betting_markets
 
@@ -157,33 +322,23 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
         O: pd.DataFrame,
     ) -> tuple[pd.DataFrame, pd.DataFrame, list[str]]:
 
-        # Check number of samples
-        check_consistent_length(X, O)
+        if not _is_trusted(X, O):
 
-        # Check data type
-        if not isinstance(X, pd.DataFrame) or not isinstance(X.index, pd.DatetimeIndex):
-            error_msg = 'Input data `X` should be pandas dataframe with a date index.'
-            raise TypeError(error_msg)
-        if not isinstance(O, pd.DataFrame):
-            error_msg = 'Odds data `O` should be pandas dataframe.'
-            raise TypeError(error_msg)
+            # Check number of samples
+            check_consistent_length(X, O)
+
+            # Check data type
+            if not isinstance(X, pd.DataFrame) or not isinstance(X.index, pd.DatetimeIndex):
+                error_msg = 'Input data `X` should be pandas dataframe with a date index.'
+                raise TypeError(error_msg)
+            if not isinstance(O, pd.DataFrame):
+                error_msg = 'Odds data `O` should be pandas dataframe.'
+                raise TypeError(error_msg)
 
         # Check O columns
-        O_cols = [col.split('__') for col in O.columns]
-        error_msg = (
-            "Odds data column names should follow a naming "
-            "convention of the form `f'odds__{bookmaker}__{betting_market_prefix}__{betting_market_target}'`"
-        )
-        if {len(tokens) for tokens in O_cols} != {4}:
-            raise ValueError(error_msg)
-        O_prefix, O_bookmakers, *O_betting_markets_tokens = zip(*O_cols, strict=True)
-        if set(O_prefix) != {'odds'}:
-            error_msg = 'Prefixes of odds data column names should be equal to `odds`.'
-            raise ValueError(error_msg)
-        if len(set(O_bookmakers)) != 1:
-            error_msg = 'Bookmakers of odds data column names should be unique.'
-            raise ValueError(error_msg)
-        O_betting_markets = ['__'.join(tokens) for tokens in zip(*O_betting_markets_tokens, strict=True)]
+        columns_error_msg, O_betting_markets = _get_columns_cached(O.columns, 'odds', _resolve_odds_columns)
+        if columns_error_msg is not None:
+            raise ValueError(columns_error_msg)
 
         return X, O, O_betting_markets
 
@@ -196,12 +351,10 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
         return np.array([], dtype=float)
 
     def _normalize_proba(self: Self, Y_proba_pred: Data) -> Data:
-        for events in self.COMPLEMENTARY_EVENTS:
-            if set(self.betting_markets_).issuperset(events):
-                mask = np.isin(self.betting_markets_, events)
-                Y_proba_pred_sum = Y_proba_pred[:, mask].sum(axis=1)
-                Y_proba_pred_sum[Y_proba_pred_sum == 0.0] = self.TOL
-                Y_proba_pred[:, mask] = Y_proba_pred[:, mask] / Y_proba_pred_sum.reshape(-1, 1)
+        for indices in self._get_market_layout().complete_groups:
+            Y_proba_pred_sum = Y_proba_pred[:, indices].sum(axis=1)
+            Y_proba_pred_sum[Y_proba_pred_sum == 0.0] = self.TOL
+            Y_proba_pred[:, indices] = Y_proba_pred[:, indices] / Y_proba_pred_sum.reshape(-1, 1)
         return Y_proba_pred
 
     def fit(self: Self, X: pd.DataFrame, Y: pd.DataFrame, O: pd.DataFrame | None = None) -> Self:
@@ -242,7 +395,8 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
                 The positive class probabilities.
         """
         check_is_fitted(self)
-        _check_feature_names(self, X, reset=False)
+        if not _is_trusted(X):
+            _check_feature_names(self, X, reset=False)
         if X.empty:
             return np.empty((0, self.betting_markets_.size), dtype=float)
         Y_proba_pred = self._predict_proba(X)
@@ -287,21 +441,33 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
         if not set(O_betting_markets).issuperset(self.betting_markets_):
             error_msg = 'Odds data do not include selected betting markets.'
             raise ValueError(error_msg)
-        O = O[self._get_feature_names_odds(O)]
-        B_pred = Y_proba_pred * O > 1
-        B_pred_selected = []
-        for events in self.COMPLEMENTARY_EVENTS:
-            events_indices = np.where([market in events for market in self.betting_markets_])[0]
-            if events_indices.size > 0:
-                estimated_returns = np.nan_to_num(
-                    (O.iloc[:, events_indices] * Y_proba_pred[:, events_indices] - 1).to_numpy(),
-                )
-                estimated_returns += [eps * self.TOL for eps in range(estimated_returns.shape[1])]
-                mask = estimated_returns != np.max(estimated_returns, axis=1).reshape(-1, 1)
-                B_pred_events = B_pred.iloc[:, events_indices].copy()
-                B_pred_events[mask] = False
-                B_pred_selected.append(B_pred_events)
-        return pd.concat(B_pred_selected, axis=1).to_numpy()
+        O_values = O.to_numpy()[:, self._get_odds_positions(O)]
+        if O_values.dtype.kind != 'f':
+            O_values = O_values.astype(float)
+        return self._bet(Y_proba_pred, O_values)
+
+    def _get_returns(
+        self: Self,
+        X: pd.DataFrame,
+        Y: pd.DataFrame,
+        O: pd.DataFrame,
+    ) -> tuple[np.ndarray, BoolData, BoolData]:
+        """Get the returns, the value bets and the winning bets of the selected betting markets."""
+        check_is_fitted(self)
+        X, Y, Y_betting_markets = self._validate_X_Y(X, Y)
+        X, O, O_betting_markets = self._validate_X_O(X, O)
+        if Y_betting_markets != O_betting_markets:
+            error_msg = 'Output and odds data column names are not compatible.'
+            raise ValueError(error_msg)
+        if not _is_trusted(X):
+            _check_feature_names(self, X, reset=False)
+        Y_values = Y.to_numpy(dtype=bool)[:, self._get_output_positions(Y)]
+        O_values = O.to_numpy()[:, self._get_odds_positions(O)]
+        if O_values.dtype.kind != 'f':
+            O_values = O_values.astype(float)
+        with _trusted_data(X, O):
+            value_bets = self.bet(X, O)
+        return np.nan_to_num((Y_values * O_values - 1) * value_bets), value_bets, Y_values & value_bets
 
     def score(self: Self, X: pd.DataFrame, Y: pd.DataFrame, O: pd.DataFrame) -> float:
         """Return the annual sharpe ratio on the given data.
@@ -320,28 +486,8 @@ class BaseBettor(MultiOutputMixin, ClassifierMixin, BaseEstimator, metaclass=ABC
             score:
                 Annual sharpe ratio of predicted value bets.
         """
-        check_is_fitted(self)
-        X, Y, Y_betting_markets = self._validate_X_Y(X, Y)
-        X, O, O_betting_markets = self._validate_X_O(X, O)
-        if Y_betting_markets != O_betting_markets:
-            error_msg = 'Output and odds data column names are not compatible.'
-            raise ValueError(error_msg)
-        Y = Y[self.feature_names_out_]
-        O = O[self._get_feature_names_odds(O)]
-        returns = np.sum(
-            np.nan_to_num(
-                (Y.to_numpy().astype(int) * O.to_numpy().astype(float) - 1) * self.bet(X, O).astype(int),
-            ),
-            axis=1,
-        )
-        returns = pd.DataFrame(returns).set_index(X.index).groupby('date').sum()
-        dates = pd.DataFrame(pd.date_range(returns.index.min(), returns.index.max()), columns=['date'])
-        returns = dates.merge(returns.reset_index(), how='left')
-        returns_mean, returns_std = returns[0].fillna(0).mean(), returns[0].fillna(0).std()
-        if returns_std == 0 or np.isnan(returns_std):
-            max_sharpe_ratio = 100.0
-            return max_sharpe_ratio if returns_mean > 0 else -max_sharpe_ratio
-        return np.sqrt(365) * returns_mean / returns_std
+        returns, _, _ = self._get_returns(X, Y, O)
+        return _get_sharpe_ratio(_get_daily_returns(X.index, returns.sum(axis=1)))
 
 
 def save_bettor(bettor: BaseBettor, path: str) -> None:
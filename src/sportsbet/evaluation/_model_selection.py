@@ -7,7 +7,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from copy import deepcopy
-from typing import Any
+from typing import Any, ClassVar
 
 import numpy as np
 import pandas as pd
@@ -17,11 +17,12 @@ from sklearn import get_config, set_config
 from sklearn.exceptions import NotFittedError
 from sklearn.model_selection import GridSearchCV, TimeSeriesSplit
 from sklearn.utils import check_consistent_length
+from sklearn.utils.metadata_routing import MetadataRequest
 from sklearn.utils.validation import check_is_fitted
 from typing_extensions import Self
 
 from .. import BoolData, Data, Indices
-from ._base import BaseBettor
+from ._base import BaseBettor, _get_daily_returns, _get_sharpe_ratio, _trusted_data
 
 TSCV = TimeSeriesSplit(n_splits=3)
 
@@ -35,11 +36,13 @@ def _fit_bet(
     O: pd.DataFrame,
 ) -> dict:
 
-    # Fit bettor
-    bettor.fit(X.iloc[train_ind], Y.iloc[train_ind], O.iloc[train_ind])
+    with _trusted_data(X, Y, O):
 
-    # Predict value bets
-    value_bets = bettor.bet(X.iloc[test_ind], O.iloc[test_ind])
+        # Fit bettor
+        bettor.fit(X.iloc[train_ind], Y.iloc[train_ind], O.iloc[train_ind])
+
+        # Predict value bets
+        value_bets = bettor.bet(X.iloc[test_ind], O.iloc[test_ind])
 
     # Calculate returns
     returns = np.nan_to_num(
@@ -223,15 +226,15 @@ def value_bet_backtest(
         current_O = O.iloc[[idx]]
 
         # Get predictions and odds
-        proba = bettor.predict_proba(current_X)
-        bets = bettor.bet(current_X, current_O)
+        with _trusted_data(X, O):
+            proba = bettor.predict_proba(current_X)
+            bets = bettor.bet(current_X, current_O)
 
         # Process each betting market
         for market_idx, market in enumerate(bettor.betting_markets_):
             if bets[0, market_idx]:  # If we have a bet for this market
                 # Get odds for this market
-                odds_col = [col for col in current_O.columns
-                           if '__'.join(col.split('__')[2:]) == market][0]
+                odds_col = [col for col in current_O.columns if '__'.join(col.split('__')[2:]) == market][0]
                 odds = current_O.iloc[0][odds_col]
 
                 # Calculate Kelly stake
@@ -242,16 +245,11 @@ def value_bet_backtest(
                 # Limit stake to available bankroll with realistic constraints
                 max_stake_pct = 0.02  # Maximum 2% of bankroll
                 max_stake_abs = 500.0  # Maximum 500€ absolute
-                stake = min(
-                    kelly_stake * bankroll,
-                    bankroll * max_stake_pct,
-                    max_stake_abs
-                )
+                stake = min(kelly_stake * bankroll, bankroll * max_stake_pct, max_stake_abs)
 
                 if stake > 0:
                     # Check outcome
-                    outcome_col = [col for col in current_Y.columns
-                                 if '__'.join(col.split('__')[1:]) == market][0]
+                    outcome_col = [col for col in current_Y.columns if '__'.join(col.split('__')[1:]) == market][0]
                     outcome = current_Y.iloc[0][outcome_col]
 
                     # Calculate return
@@ -289,15 +287,15 @@ def value_bet_backtest(
 
     # Sharpe ratio and drawdown calculation
     if returns:
-        daily_returns = pd.Series(returns, index=bet_dates).groupby(pd.Grouper(freq='D')).sum()
-        daily_returns = daily_returns.reindex(pd.date_range(daily_returns.index.min(), daily_returns.index.max()), fill_value=0)
-        sharpe_ratio = np.sqrt(365) * daily_returns.mean() / daily_returns.std() if daily_returns.std() > 0 else 0
+        daily_returns = _get_daily_returns(pd.DatetimeIndex(bet_dates).floor('D'), np.array(returns, dtype=float))
+        returns_std = daily_returns.std(ddof=1) if daily_returns.size > 1 else np.nan
+        sharpe_ratio = np.sqrt(365) * daily_returns.mean() / returns_std if returns_std > 0 else 0
 
         # Calculate maximum drawdown
-        cumulative = (1 + daily_returns).cumprod()
-        peak = cumulative.expanding().max()
+        cumulative = np.cumprod(1 + daily_returns)
+        peak = np.maximum.accumulate(cumulative)
         drawdown_series = (cumulative - peak) / peak
-        max_drawdown = drawdown_series.min()
+        max_drawdown = np.nanmin(drawdown_series)
     else:
         sharpe_ratio = 0
         max_drawdown = 0
@@ -321,6 +319,120 @@ def value_bet_backtest(
     }
 
 
+class BettingScorer:
+    """Scorer of multiple betting metrics.
+
+    The returns of the value bets are calculated once and all the selected
+    betting metrics are derived from them. It can be used as the `scoring`
+    parameter of `BettorGridSearchCV`, with `refit` set to any of the
+    selected metrics, when the odds data `O` are provided to the fit method.
+
+    The available betting metrics are the following:
+
+    - `'sharpe_ratio'`: The annual sharpe ratio of the daily returns, as returned by the `score` method of bettors.
+    - `'yield'`: The average return per bet.
+    - `'roi'`: The total return of the bets relative to the initial cash.
+    - `'hit_rate'`: The fraction of the bets that won.
+    - `'max_drawdown'`: The maximum decline of the cash relative to its previous peak, as a non-positive number.
+
+    Read more in the [user guide][user-guide].
+
+    Args:
+        metrics:
+            The names of the betting metrics to calculate. The default value
+            `None` selects all the available betting metrics.
+
+    Examples:
+        >>> from sklearn.model_selection import TimeSeriesSplit
+        >>> from sportsbet.datasets import DummySoccerDataLoader
+        >>> from sportsbet.evaluation import BettingScorer, BettorGridSearchCV, OddsComparisonBettor
+        >>> X, Y, O = DummySoccerDataLoader().extract_train_data(odds_type='williamhill')
+        >>> scorer = BettingScorer(metrics=['sharpe_ratio', 'roi'])
+        >>> bettor = OddsComparisonBettor().fit(X, Y, O)
+        >>> sorted(scorer(bettor, X, Y, O))
+        ['roi', 'sharpe_ratio']
+        >>> bettor = BettorGridSearchCV(
+        ... estimator=OddsComparisonBettor(),
+        ... param_grid={'alpha': [0.02, 0.05]},
+        ... scoring=scorer,
+        ... refit='roi',
+        ... cv=TimeSeriesSplit(2),
+        ... ).fit(X, Y, O)
+        >>> 'mean_test_roi' in bettor.cv_results_
+        True
+    """
+
+    METRICS: ClassVar[tuple[str, ...]] = ('sharpe_ratio', 'yield', 'roi', 'hit_rate', 'max_drawdown')
+
+    def __init__(self: Self, metrics: list[str] | None = None) -> None:
+        self.metrics = metrics
+
+    def _check_metrics(self: Self) -> list[str]:
+        if self.metrics is None:
+            return list(self.METRICS)
+        error_msg = f'Parameter `metrics` should be a list of betting metrics from {", ".join(self.METRICS)}.'
+        if not isinstance(self.metrics, list):
+            raise TypeError(error_msg)
+        if not self.metrics or not set(self.metrics).issubset(self.METRICS):
+            raise ValueError(error_msg)
+        return self.metrics
+
+    def get_metadata_routing(self: Self) -> MetadataRequest:
+        """Get the metadata routing of the scorer.
+
+        Returns:
+            routing:
+                The metadata request of the scorer that requests the odds data `O`.
+        """
+        routing = MetadataRequest(owner=self.__class__.__name__)
+        routing.score.add_request(param='O', alias=True)
+        return routing
+
+    def __call__(
+        self: Self,
+        estimator: BaseBettor,
+        X: pd.DataFrame,
+        Y: pd.DataFrame,
+        O: pd.DataFrame | None = None,
+    ) -> dict[str, float]:
+        """Calculate the betting metrics of the bettor on the given data.
+
+        Args:
+            estimator:
+                The fitted bettor.
+
+            X:
+                The input data.
+
+            Y:
+                The output data.
+
+            O:
+                The odds data.
+
+        Returns:
+            scores:
+                The values of the selected betting metrics.
+        """
+        metrics = self._check_metrics()
+        if O is None:
+            error_msg = 'The betting scorer requires the odds data `O` to be provided.'
+            raise TypeError(error_msg)
+        returns, value_bets, wins = estimator._get_returns(X, Y, O)
+        n_bets = value_bets.sum()
+        daily_returns = _get_daily_returns(X.index, returns.sum(axis=1))
+        cash = estimator.init_cash_ + estimator.stake_ * np.cumsum(daily_returns)
+        peaks = np.maximum.accumulate(np.concatenate([[estimator.init_cash_], cash]))[1:]
+        scores = {
+            'sharpe_ratio': _get_sharpe_ratio(daily_returns),
+            'yield': returns[value_bets].mean() if n_bets > 0 else 0.0,
+            'roi': estimator.stake_ * returns.sum() / estimator.init_cash_,
+            'hit_rate': wins.sum() / n_bets if n_bets > 0 else 0.0,
+            'max_drawdown': ((cash - peaks) / peaks).min() if cash.size > 0 else 0.0,
+        }
+        return {metric: float(scores[metric]) for metric in metrics}
+
+
 class BettorGridSearchCV(GridSearchCV, BaseBettor):
     """Exhaustive search over specified parameter values for a bettor.
 
@@ -585,7 +697,13 @@ class BettorGridSearchCV(GridSearchCV, BaseBettor):
             error_msg = 'Parameter `cv` should be a TimeSeriesSplit cross-validator object.'
             raise TypeError(error_msg)
         initial_scoring = deepcopy(self.scoring)
-        if O is not None and initial_scoring is None:
+        if O is None and isinstance(initial_scoring, BettingScorer):
+            error_msg = (
+                'The betting scorer requires the odds data `O` to be provided. '
+                'Invoke the fit method as `object.fit(X, Y, O)`.'
+            )
+            raise TypeError(error_msg)
+        if O is not None and (initial_scoring is None or isinstance(initial_scoring, BettingScorer)):
             enable_metadata_routing = get_config().get('enable_metadata_routing')
             set_config(enable_metadata_routing=True)
             self.estimator.set_fit_request(O=True).set_score_request(O=True)
@@ -629,7 +747,11 @@ class BettorGridSearchCV(GridSearchCV, BaseBettor):
             self:
                 The fitted bettor object.
         """
-        self._fit(X, Y, O)
+        X, Y, _ = self._validate_X_Y(X, Y)
+        if O is not None:
+            X, O, _ = self._validate_X_O(X, O)
+        with _trusted_data(X, Y, O):
+            self._fit(X, Y, O)
         if hasattr(self, 'best_estimator_'):
             self.init_cash_ = self.best_estimator_.init_cash_
             self.stake_ = self.best_estimator_.stake_
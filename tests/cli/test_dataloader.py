@@ -92,3 +92,20 @@ def test_dataloader_fixtures(cli_runner, cli_config_path):
     assert 'Fixtures odds data' in result.output
     assert (data_path / 'X_fix.csv').exists()
     assert (data_path / 'O_fix.csv').exists()
+
+
+def test_dataloader_mirror_error(cli_runner):
+    """Test dataloader mirror command, missing mirror path."""
+    result = cli_runner.invoke(main, ['dataloader', 'mirror', '-c', 'config.py'])
+    assert result.exit_code != 0, result.output
+    assert 'Error: Missing option \'--mirror-path\' / \'-m\'.' in result.output
+
+
+def test_dataloader_mirror_not_supported(cli_runner, cli_config_path):
+    """Test dataloader mirror command for a dataloader without mirroring."""
+    result = cli_runner.invoke(
+        main,
+        ['dataloader', 'mirror', '-c', cli_config_path, '-m', str(cli_config_path.parent / 'mirror')],
+    )
+    assert result.exit_code == 0, result.output
+    assert 'Dataloader does not support mirroring of its data files.' in result.output
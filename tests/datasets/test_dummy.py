@@ -1,5 +1,6 @@
 """Test the DummySoccerDataLoader class."""
 
+import asyncio
 import re
 from typing import cast
 
@@ -8,7 +9,7 @@ import pandas as pd
 import pytest
 from sklearn.model_selection import ParameterGrid
 
-from sportsbet.datasets import DummySoccerDataLoader
+from sportsbet.datasets import DATA_CACHE, DummySoccerDataLoader, SyntheticSoccerDataLoader
 
 
 def test_get_all_params():
@@ -65,6 +66,19 @@ def test_param_grid():
     )
 
 
+def test_param_grid_multiple():
+    """Test the parameters grid with multiple dictionaries."""
+    dataloader = DummySoccerDataLoader(
+        param_grid=[{'league': ['Spain'], 'year': [1999, 1997]}, {'division': [2], 'league': ['England']}],
+    )
+    dataloader._check_param_grid()
+    assert list(dataloader.param_grid_) == [
+        {'division': 2, 'league': 'Spain', 'year': 1999},
+        {'division': 1, 'league': 'Spain', 'year': 1997},
+        {'division': 2, 'league': 'England', 'year': 1997},
+    ]
+
+
 def test_param_grid_false_names():
     """Test the raise of value error for parameters grid for false names."""
     false_param_grid = {'Division': [4], 'league': ['Greece']}
@@ -94,6 +108,14 @@ def test_param_grid_false_values():
         dataloader.extract_train_data()
 
 
+@pytest.mark.parametrize('param_grid', [{}, [{}], [{'league': ['Spain']}, {}]])
+def test_param_grid_empty_params(param_grid):
+    """Test the raise of value error for parameters grid with empty dictionaries."""
+    dataloader = DummySoccerDataLoader(param_grid)
+    with pytest.raises(ValueError, match='Parameter grid includes an empty dictionary of parameters'):
+        dataloader.extract_train_data()
+
+
 def test_drop_na_thres_default():
     """Test default value for drop na threshold."""
     dataloader = DummySoccerDataLoader()
@@ -573,3 +595,191 @@ def test_extract_fixtures_data_raise_error():
         match='Extract the training data before extracting the fixtures data.',
     ):
         dataloader.extract_fixtures_data()
+
+
+def test_extract_data_categorical():
+    """Test the extraction of training and fixtures data with categorical names."""
+    dataloader = DummySoccerDataLoader(param_grid={'league': ['Greece', 'Spain']}, categorical=True)
+    X_train, Y_train, O_train = dataloader.extract_train_data(odds_type='interwetten')
+    X_fix, _, _ = dataloader.extract_fixtures_data()
+    X_train_expected, Y_train_expected, O_train_expected = DummySoccerDataLoader(
+        param_grid={'league': ['Greece', 'Spain']},
+    ).extract_train_data(odds_type='interwetten')
+    categorical_cols = ['league', 'home_team', 'away_team']
+    for col in categorical_cols:
+        assert X_train[col].dtype == X_fix[col].dtype == pd.CategoricalDtype(dataloader.categories_[col])
+    pd.testing.assert_frame_equal(X_train.astype(dict.fromkeys(categorical_cols, object)), X_train_expected)
+    pd.testing.assert_frame_equal(Y_train, Y_train_expected)
+    pd.testing.assert_frame_equal(O_train, O_train_expected)
+    assert 'Barcelona' in dataloader.categories_['home_team']
+    categories = dataloader.categories_
+    dataloader.extract_train_data()
+    for col, col_categories in categories.items():
+        pd.testing.assert_index_equal(dataloader.categories_[col], col_categories)
+
+
+def test_extract_data_dtype():
+    """Test the extraction of training and fixtures data with a floating point data type."""
+    dataloader = DummySoccerDataLoader()
+    X_train, Y_train, O_train = dataloader.extract_train_data(odds_type='interwetten', dtype='float32')
+    X_fix, _, O_fix = dataloader.extract_fixtures_data()
+    X_train_expected, Y_train_expected, O_train_expected = DummySoccerDataLoader().extract_train_data(
+        odds_type='interwetten',
+    )
+    assert dataloader.dtype_ == np.float32
+    for data in (X_train, X_fix):
+        assert set(data.select_dtypes(include='floating').dtypes) == {np.dtype(np.float32)}
+    assert set(O_train.dtypes) == set(O_fix.dtypes) == {np.dtype(np.float32)}
+    pd.testing.assert_frame_equal(X_train, X_train_expected, check_dtype=False)
+    pd.testing.assert_frame_equal(Y_train, Y_train_expected)
+    pd.testing.assert_frame_equal(O_train, O_train_expected, check_dtype=False)
+
+
+@pytest.mark.parametrize(('dtype', 'error'), [('int64', ValueError), ('bool', ValueError), ('foo', TypeError)])
+def test_extract_data_dtype_raise_error(dtype, error):
+    """Test the raise of error for wrong data type."""
+    dataloader = DummySoccerDataLoader()
+    with pytest.raises(error, match='Parameter `dtype` should be a floating point data type'):
+        dataloader.extract_train_data(dtype=dtype)
+
+
+def test_validate_data_cache():
+    """Test that the validated data are cached until the parameters grid changes or the data are refreshed."""
+    dataloader = DummySoccerDataLoader(param_grid={'league': ['Greece']})
+    X_train, Y_train, _ = dataloader.extract_train_data()
+    data = dataloader._validate_data()
+    assert dataloader._validate_data() is data
+    X_train_cached, Y_train_cached, _ = dataloader.extract_train_data()
+    pd.testing.assert_frame_equal(X_train_cached, X_train)
+    pd.testing.assert_frame_equal(Y_train_cached, Y_train)
+    assert dataloader.refresh()._validate_data() is not data
+    dataloader.param_grid = {'league': ['Spain']}
+    dataloader.extract_train_data()
+    assert dataloader._validate_data() is not data
+
+
+def test_extract_data_async():
+    """Test that the asynchronous methods return the same data as the synchronous ones."""
+    dataloader = DummySoccerDataLoader(param_grid={'league': ['Greece']})
+    X_train, Y_train, O_train = dataloader.extract_train_data(odds_type='interwetten')
+    X_fix, _, O_fix = dataloader.extract_fixtures_data()
+    odds_types = dataloader.get_odds_types()
+
+    async def extract() -> tuple:
+        async_dataloader = DummySoccerDataLoader(param_grid={'league': ['Greece']})
+        train_data = await async_dataloader.aextract_train_data(odds_type='interwetten')
+        return train_data, await async_dataloader.aextract_fixtures_data(), await async_dataloader.aget_odds_types()
+
+    (X_train_async, Y_train_async, O_train_async), (X_fix_async, _, O_fix_async), odds_types_async = asyncio.run(
+        extract(),
+    )
+    pd.testing.assert_frame_equal(X_train_async, X_train)
+    pd.testing.assert_frame_equal(Y_train_async, Y_train)
+    pd.testing.assert_frame_equal(O_train_async, O_train)
+    pd.testing.assert_frame_equal(X_fix_async, X_fix)
+    pd.testing.assert_frame_equal(O_fix_async, O_fix)
+    assert odds_types_async == odds_types
+
+
+def test_synthetic_data_reproducible():
+    """Test that the synthetic data do not depend on the chunk size and the selected parameters."""
+    X_train, Y_train, O_train = SyntheticSoccerDataLoader(n_leagues=2, n_seasons=2, n_teams=6).extract_train_data(
+        odds_type='pinnacle',
+    )
+    dataloader = SyntheticSoccerDataLoader(
+        param_grid={'league': ['League 2'], 'year': [2001]},
+        n_leagues=2,
+        n_seasons=2,
+        n_teams=6,
+        chunk_size=1,
+    )
+    X_train_selected, Y_train_selected, O_train_selected = dataloader.extract_train_data(odds_type='pinnacle')
+    mask = ((X_train['league'] == 'League 2') & (X_train['year'] == dataloader.start_year + 1)).to_numpy()
+    order = X_train[mask].reset_index().sort_values(['date', 'home_team', 'away_team']).index
+    order_selected = X_train_selected.reset_index().sort_values(['date', 'home_team', 'away_team']).index
+    pd.testing.assert_frame_equal(X_train_selected.iloc[order_selected], X_train[mask].iloc[order])
+    np.testing.assert_array_equal(Y_train_selected.to_numpy()[order_selected], Y_train[mask].to_numpy()[order])
+    np.testing.assert_array_equal(O_train_selected.to_numpy()[order_selected], O_train[mask].to_numpy()[order])
+
+
+def test_synthetic_data_shape():
+    """Test the number of the generated matches and fixtures."""
+    n_leagues, n_divisions, n_seasons, n_teams = 2, 3, 4, 5
+    dataloader = SyntheticSoccerDataLoader(
+        n_leagues=n_leagues,
+        n_divisions=n_divisions,
+        n_seasons=n_seasons,
+        n_teams=n_teams,
+        categorical=True,
+    )
+    X_train, Y_train, _ = dataloader.extract_train_data()
+    X_fix, _, _ = dataloader.extract_fixtures_data()
+    assert len(dataloader.param_grid_) == n_leagues * n_divisions * n_seasons
+    assert X_train.shape[0] == n_leagues * n_divisions * n_seasons * n_teams * (n_teams - 1)
+    assert X_fix.shape[0] == n_leagues * n_divisions * (n_teams // 2)
+    assert (Y_train.iloc[:, :3].sum(axis=1) == 1).all()
+    assert (Y_train.iloc[:, 3:].sum(axis=1) == 1).all()
+    assert isinstance(X_train['home_team'].dtype, pd.CategoricalDtype)
+
+
+def test_synthetic_data_categorical_names():
+    """Test that the generated names are categoricals."""
+    dataloader = SyntheticSoccerDataLoader(n_leagues=2, n_seasons=2, n_teams=4)
+    X_train, _, _ = dataloader.extract_train_data()
+    X_fix, _, _ = dataloader.extract_fixtures_data()
+    assert X_train.select_dtypes(include=object).empty
+    assert isinstance(X_fix['league'].dtype, pd.CategoricalDtype)
+    assert X_train['home_team'].cat.categories.tolist() == dataloader._get_teams()
+
+
+def test_synthetic_data_over_budget(monkeypatch):
+    """Test that the data that are not cached are generated once per dataloader."""
+    DATA_CACHE.clear()
+    monkeypatch.setattr(DATA_CACHE, 'max_size', 1)
+    dataloader = SyntheticSoccerDataLoader(n_leagues=1, n_seasons=2, n_teams=4)
+    n_generations = 0
+    get_data = SyntheticSoccerDataLoader._get_data
+
+    def counted_get_data(self):
+        nonlocal n_generations
+        n_generations += 1
+        return get_data(self)
+
+    monkeypatch.setattr(SyntheticSoccerDataLoader, '_get_data', counted_get_data)
+    dataloader.extract_train_data()
+    dataloader.extract_fixtures_data()
+    dataloader.get_odds_types()
+    assert n_generations == 1
+    assert DATA_CACHE.info().misses == 1
+    assert DATA_CACHE.info().length == 0
+
+
+def test_synthetic_data_cache_cleared():
+    """Test that the validated data are reloaded when the cache is cleared."""
+    DATA_CACHE.clear()
+    dataloader = SyntheticSoccerDataLoader(n_leagues=1, n_seasons=2, n_teams=4)
+    X_train, _, _ = dataloader.extract_train_data()
+    dataloader.extract_train_data()
+    assert DATA_CACHE.info().misses == 1
+    DATA_CACHE.clear()
+    X_train_reloaded, _, _ = dataloader.extract_train_data()
+    assert DATA_CACHE.info().misses == 1
+    pd.testing.assert_frame_equal(X_train_reloaded, X_train)
+
+
+def test_synthetic_data_all_params():
+    """Test that the available parameters of the dataloader depend on the generator parameters."""
+    dataloader = SyntheticSoccerDataLoader(n_leagues=2, n_divisions=1, n_seasons=3, start_year=2010)
+    all_params = dataloader.get_all_params()
+    assert len(all_params) == 2 * 1 * 3
+    assert {params['league'] for params in all_params} == {'League 1', 'League 2'}
+    assert {params['year'] for params in all_params} == {2010, 2011, 2012}
+    assert len(SyntheticSoccerDataLoader.get_all_params()) == 5 * 2 * 10
+    with pytest.raises(ValueError, match='not allowed by available data'):
+        SyntheticSoccerDataLoader({'league': ['League 3']}, n_leagues=2).extract_train_data()
+
+
+def test_synthetic_data_raise_error():
+    """Test the raise of error for wrong generator parameters."""
+    with pytest.raises(ValueError, match='n_teams == 1, must be >= 2'):
+        SyntheticSoccerDataLoader(n_teams=1).extract_train_data()
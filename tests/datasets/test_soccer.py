@@ -0,0 +1,503 @@
+"""Test the SoccerDataLoader class against a local server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sportsbet.datasets import DATA_CACHE, DataCache, DownloadError, SoccerDataLoader
+from sportsbet.datasets._soccer import _data, _utils
+from sportsbet.datasets._soccer._utils import (
+    DATA_HOME_ENV,
+    ENCODING,
+    OUTPUTS,
+    _extract_outputs,
+    _ParquetStore,
+    _parse_csv,
+    _read_csv_content,
+    _read_csvs,
+    _read_urls_content,
+    _write_atomically,
+)
+
+COLUMNS = (
+    'date,league,division,year,home_team,away_team,'
+    'odds__market_average__home_win__full_time_goals,'
+    'odds__market_average__draw__full_time_goals,'
+    'odds__market_average__away_win__full_time_goals,'
+    'target__home_team__full_time_goals,target__away_team__full_time_goals,target__home_team__shots\n'
+)
+CONTENT = {
+    '/England_1_2020.csv': COLUMNS
+    + '12/09/2019,England,1,2020,Fulham,Arsenal,3.5,3.0,2.0,0,3,5\n'
+    + '13/09/2019,England,1,2020,Liverpool,Leeds,1.5,4.0,6.0,4,3,10\n',
+    '/England_1_2021.csv': COLUMNS
+    + '12/09/2020,England,1,2021,Arsenal,Fulham,2.0,3.0,3.5,1,1,7\n'
+    + '13/09/2020,England,1,2021,Leeds,Liverpool,5.0,4.0,1.6,2,1,8\n',
+    '/fixtures.csv': COLUMNS + '01/10/2030,England,1,2021,Liverpool,Arsenal,2.0,3.5,3.5,,,\n',
+}
+
+
+class DataHandler(BaseHTTPRequestHandler):
+    """Handler that serves the data files with revalidation headers."""
+
+    content: ClassVar[dict[str, str]] = {}
+    requests: ClassVar[list[tuple[str, int]]] = []
+    failures: ClassVar[dict[str, int]] = {}
+
+    def do_GET(self) -> None:
+        """Respond to a GET request."""
+        content = self.content.get(self.path, '').encode()
+        etag = f'"{hash(content)}"'
+        if self.path not in self.content:
+            status = 404
+        elif self.failures.get(self.path):
+            self.failures[self.path] -= 1
+            status, content = 503, b''
+        elif self.headers.get('If-None-Match') == etag:
+            status, content = 304, b''
+        else:
+            status = 200
+        self.requests.append((self.path, status))
+        self.send_response(status)
+        self.send_header('ETag', etag)
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: object) -> None:
+        """Suppress logging."""
+
+
+@pytest.fixture
+def server_url(tmp_path, monkeypatch) -> Iterator[str]:
+    """Local HTTP server that stands in for the remote data."""
+    monkeypatch.setenv(DATA_HOME_ENV, str(tmp_path))
+    items = [{'name': path[1:], 'path': f'data/soccer/modelling{path}'} for path in CONTENT]
+    tree = json.dumps({'payload': {'tree': {'items': items}}})
+    DataHandler.content = {
+        **CONTENT,
+        '/tree': f'<html><script data-target="react-app.embeddedData">{tree}</script></html>',
+    }
+    DataHandler.requests = []
+    DataHandler.failures = {}
+    server = ThreadingHTTPServer(('127.0.0.1', 0), DataHandler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    url = f'http://127.0.0.1:{server.server_port}'
+    monkeypatch.setattr(_data, 'MODELLING_URL', f'{url}/tree')
+    monkeypatch.setattr(_data, 'TRAINING_URL', url + '/{league}_{division}_{year}.csv')
+    monkeypatch.setattr(_data, 'FIXTURES_URL', f'{url}/fixtures.csv')
+    SoccerDataLoader._get_full_param_grid.cache_clear()
+    SoccerDataLoader._get_latest_years.cache_clear()
+    DATA_CACHE.clear()
+    yield url
+    SoccerDataLoader._get_full_param_grid.cache_clear()
+    SoccerDataLoader._get_latest_years.cache_clear()
+    DATA_CACHE.clear()
+    server.shutdown()
+    server.server_close()
+
+
+def test_read_urls_content_revalidation(server_url):
+    """Test that cached content is revalidated with a conditional request."""
+    url = f'{server_url}/fixtures.csv'
+    assert _read_urls_content([url]) == [CONTENT['/fixtures.csv']]
+    assert _read_urls_content([url]) == [CONTENT['/fixtures.csv']]
+    assert DataHandler.requests == [('/fixtures.csv', 200), ('/fixtures.csv', 304)]
+
+
+def test_read_urls_content_closed(server_url):
+    """Test that cached content of closed URLs is served without any request."""
+    url = f'{server_url}/England_1_2020.csv'
+    assert _read_urls_content([url], closed_urls={url}) == [CONTENT['/England_1_2020.csv']]
+    assert _read_urls_content([url], closed_urls={url}) == [CONTENT['/England_1_2020.csv']]
+    assert DataHandler.requests == [('/England_1_2020.csv', 200)]
+
+
+def test_read_urls_content_retries(server_url, monkeypatch):
+    """Test that transient failures are retried."""
+    monkeypatch.setattr(_utils, 'RETRY_BACKOFF', 0.0)
+    DataHandler.failures = {'/fixtures.csv': 2}
+    assert _read_urls_content([f'{server_url}/fixtures.csv']) == [CONTENT['/fixtures.csv']]
+    assert DataHandler.requests == [('/fixtures.csv', 503), ('/fixtures.csv', 503), ('/fixtures.csv', 200)]
+
+
+def test_read_urls_content_failures(server_url, monkeypatch):
+    """Test that all the failed downloads are reported after the rest are completed."""
+    monkeypatch.setattr(_utils, 'RETRY_BACKOFF', 0.0)
+    DataHandler.failures = {'/England_1_2021.csv': _utils.RETRIES + 1}
+    urls = [f'{server_url}/England_1_2020.csv', f'{server_url}/England_1_2021.csv', f'{server_url}/missing.csv']
+    with pytest.raises(DownloadError, match='Failed to download 2 of 3 URLs') as error:
+        _read_csvs(urls)
+    assert list(error.value.errors) == urls[1:]
+    assert sorted(set(DataHandler.requests)) == [
+        ('/England_1_2020.csv', 200),
+        ('/England_1_2021.csv', 503),
+        ('/missing.csv', 404),
+    ]
+    assert DataHandler.requests.count(('/England_1_2021.csv', 503)) == _utils.RETRIES + 1
+    assert DataHandler.requests.count(('/missing.csv', 404)) == 1
+
+
+def test_read_urls_content_running_loop(server_url):
+    """Test that the URLs can be read when the caller runs an event loop."""
+
+    async def read() -> list[str]:
+        return _read_urls_content([f'{server_url}/fixtures.csv'])
+
+    assert asyncio.run(read()) == [CONTENT['/fixtures.csv']]
+
+
+def test_read_csvs(server_url):
+    """Test that the CSVs are parsed from the cached content."""
+    urls = [f'{server_url}{path}' for path in CONTENT]
+    first_csvs, second_csvs = _read_csvs(urls, closed_urls=urls[:1]), _read_csvs(urls, closed_urls=urls[:1])
+    for first_csv, second_csv in zip(first_csvs, second_csvs, strict=True):
+        assert first_csv.equals(second_csv)
+    assert first_csvs[0].columns.tolist() == COLUMNS.strip().split(',')
+    assert first_csvs[2]['home_team'].tolist() == ['Liverpool']
+
+
+def test_read_csvs_parse(server_url):
+    """Test that the parsing function is applied to each CSV and the order of URLs is preserved."""
+    urls = [f'{server_url}{path}' for path in reversed(CONTENT)]
+    csvs = _read_csvs(urls, parse=lambda csv: csv.assign(rows=csv.shape[0]))
+    assert [csv['year'].iloc[0] for csv in csvs] == [2021, 2021, 2020]
+    assert [csv['rows'].iloc[0] for csv in csvs] == [1, 2, 2]
+
+
+@pytest.mark.parametrize(
+    'content',
+    [
+        CONTENT['/England_1_2020.csv'] + '14/09/2019,England,1,2020,Leeds,Fulham,-,3.0,,1,\n',
+        CONTENT['/England_1_2020.csv'] + '14/09/2019,England,1,2020,Leeds,Fulham,2.0,3.0,4.0,1,1,1,7\n',
+    ],
+)
+def test_parse_csv(content):
+    """Test that the CSV content is parsed with the schema data types and malformed lines are skipped."""
+    dataloader = SoccerDataLoader()
+    csv = _parse_csv(content.encode(), dict(dataloader.SCHEMA), (), dataloader._get_parse_function())
+    expected_csv = dataloader._get_parse_function()(_read_csv_content(content.encode()))
+    pd.testing.assert_frame_equal(csv, expected_csv)
+
+
+def test_write_atomically_threads(tmp_path):
+    """Test that the concurrent writes of a file by threads of the same process do not collide."""
+    path = tmp_path / 'fixtures.csv'
+    contents = [str(ind).encode() * 1000 for ind in range(20)]
+    with ThreadPoolExecutor(len(contents)) as executor:
+        list(executor.map(_write_atomically, [path] * len(contents), contents))
+    assert path.read_bytes() in contents
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_parquet_store(tmp_path):
+    """Test that the parsed data are stored and loaded with their types."""
+    pytest.importorskip('pyarrow')
+    store = _ParquetStore(tmp_path)
+    params = {'league': 'England', 'division': 1, 'year': 2020}
+    data = pd.DataFrame(
+        {
+            'date': pd.to_datetime(['12/09/2020', '13/09/2020'], format='%d/%m/%Y'),
+            'league': ['England', 'England'],
+            'division': np.array([1, 1], dtype=np.int64),
+            'home_team': ['Fulham', np.nan],
+            'odds__market_average__draw__full_time_goals': [3.5, np.nan],
+        },
+    )
+    assert store.get(params) is None
+    store.put(params, data)
+    pd.testing.assert_frame_equal(store.get(params), data)
+    pd.testing.assert_frame_equal(store.get(params, excluded_cols=['home_team']), data.drop(columns=['home_team']))
+
+
+def test_refresh(server_url):
+    """Test that refreshing the data downloads only the index, the open season and the fixtures."""
+    dataloader = SoccerDataLoader()
+    X_train, *_ = dataloader.extract_train_data(odds_type='market_average')
+    DataHandler.content['/England_1_2021.csv'] = DataHandler.content['/England_1_2021.csv'].replace('Leeds', 'Chelsea')
+    DataHandler.requests.clear()
+    X_train_cached, *_ = dataloader.extract_train_data(odds_type='market_average')
+    pd.testing.assert_frame_equal(X_train_cached, X_train)
+    assert DataHandler.requests == []
+    X_train_refreshed, *_ = dataloader.refresh().extract_train_data(odds_type='market_average')
+    assert sorted(DataHandler.requests) == [('/England_1_2021.csv', 200), ('/fixtures.csv', 304), ('/tree', 304)]
+    assert X_train_refreshed['home_team'].tolist() == ['Fulham', 'Liverpool', 'Arsenal', 'Chelsea']
+    X_train_reloaded, *_ = SoccerDataLoader().extract_train_data(odds_type='market_average')
+    pd.testing.assert_frame_equal(X_train_refreshed, X_train_reloaded)
+
+
+def test_refresh_closed_season(server_url, tmp_path):
+    """Test that refreshing the data downloads again a season that closed since the data were loaded."""
+    mirror = tmp_path / 'mirror'
+    dataloader = SoccerDataLoader({'year': [2021]}).mirror(mirror)
+    dataloader = SoccerDataLoader({'year': [2021]}, data_source=mirror)
+    X_train, *_ = dataloader.extract_train_data(odds_type='market_average')
+    content = (mirror / 'England_1_2021.csv').read_text(encoding=ENCODING)
+    (mirror / 'England_1_2021.csv').write_text(content + content.splitlines()[-1] + '\n', encoding=ENCODING)
+    (mirror / 'England_1_2022.csv').write_text(content, encoding=ENCODING)
+    X_train_refreshed, *_ = dataloader.refresh().extract_train_data(odds_type='market_average')
+    assert X_train_refreshed.shape[0] == X_train.shape[0] + 1
+    DATA_CACHE.clear()
+    X_train_reloaded, *_ = SoccerDataLoader({'year': [2021]}, data_source=mirror).extract_train_data(
+        odds_type='market_average',
+    )
+    pd.testing.assert_frame_equal(X_train_refreshed, X_train_reloaded)
+
+
+def test_params_index(server_url):
+    """Test that the parameters index is stored and used within its time to live."""
+    all_params = SoccerDataLoader.get_all_params()
+    SoccerDataLoader._get_full_param_grid.cache_clear()
+    assert SoccerDataLoader.get_all_params() == all_params
+    assert DataHandler.requests == [('/tree', 200)]
+    SoccerDataLoader().refresh()
+    assert DataHandler.requests == [('/tree', 200), ('/tree', 304)]
+
+
+def test_params_index_outdated(server_url, monkeypatch):
+    """Test that the outdated parameters index is used when the remote repository is not reachable."""
+    all_params = SoccerDataLoader.get_all_params()
+    SoccerDataLoader._get_full_param_grid.cache_clear()
+    monkeypatch.setattr(_data, 'PARAMS_INDEX_TTL', 0)
+    monkeypatch.setattr(_data, 'MODELLING_URL', 'http://127.0.0.1:1/tree')
+    with pytest.warns(UserWarning, match='outdated index'):
+        assert SoccerDataLoader.get_all_params() == all_params
+
+
+def test_unused_cols(server_url):
+    """Test that the target columns not used by any output are not loaded."""
+    pytest.importorskip('pyarrow')
+    dataloader = SoccerDataLoader()
+    assert 'target__home_team__shots' in dataloader._get_unused_cols()
+    X_train, *_ = dataloader.extract_train_data(odds_type='market_average')
+    X_train_stored, *_ = SoccerDataLoader().extract_train_data(odds_type='market_average')
+    pd.testing.assert_frame_equal(X_train, X_train_stored)
+    assert 'target__home_team__shots' not in dataloader._get_data().columns
+
+
+def test_unused_cols_stored(server_url):
+    """Test that the stored data include the unused columns of the dataloader that stored them."""
+    pytest.importorskip('pyarrow')
+
+    class ShotsDataLoader(SoccerDataLoader):
+        OUTPUTS: ClassVar = [
+            *OUTPUTS,
+            ('output__home_team__shots', lambda data: data['target__home_team__shots'].gt(6)),
+        ]
+
+    SoccerDataLoader({'year': [2020]}).extract_train_data(odds_type='market_average')
+    DataHandler.requests.clear()
+    dataloader = ShotsDataLoader({'year': [2020]})
+    _, Y_train, _ = dataloader.extract_train_data()
+    assert ('/England_1_2020.csv', 200) not in DataHandler.requests
+    data = dataloader._get_data()
+    assert data.loc[~data['fixtures'], 'target__home_team__shots'].tolist() == [5.0, 10.0]
+    assert Y_train['output__home_team__shots'].tolist() == [False, True]
+
+
+@pytest.mark.parametrize('pyarrow_available', [False, True])
+def test_unused_cols_parsed(server_url, monkeypatch, pyarrow_available):
+    """Test that the unused columns are parsed only for the closed seasons that are stored."""
+    if pyarrow_available:
+        pytest.importorskip('pyarrow')
+    monkeypatch.setattr(_utils, 'PYARROW_AVAILABLE', pyarrow_available)
+    parsed_cols = {}
+    parse_data = _data._parse_data
+
+    def recorded_parse_data(data, data_types):
+        parsed_cols[data['date'].iloc[0]] = 'target__home_team__shots' in data.columns
+        return parse_data(data, data_types)
+
+    monkeypatch.setattr(_data, '_parse_data', recorded_parse_data)
+    SoccerDataLoader().extract_train_data(odds_type='market_average')
+    assert parsed_cols == {'12/09/2019': pyarrow_available, '12/09/2020': False, '01/10/2030': False}
+
+
+def test_convert_data_types():
+    """Test that the data types are compiled once and only columns with different data types are converted."""
+    dataloader = SoccerDataLoader()
+    assert dataloader._get_data_types() is SoccerDataLoader._get_data_types()
+    data = pd.DataFrame({'division': ['-', '2'], 'year': [2020, 2021], 'league': ['England', np.nan]})
+    data_converted = dataloader._convert_data_types(data)
+    assert data_converted['division'].tolist() == [-1, 2]
+    assert data_converted['year'].dtype == np.int64
+    assert dataloader._convert_data_types(data_converted) is data_converted
+
+
+def test_data_cache():
+    """Test the eviction and statistics of the data cache."""
+    data = pd.DataFrame({'odds': np.ones(10)})
+    size = int(data.memory_usage(deep=True).sum())
+    cache = DataCache(max_size=2 * size + 40)
+    assert cache.get('first') is None
+    cache.put('first', data).put('second', (data, np.arange(5)))
+    assert cache.get('first') is data
+    cache.put('third', data)
+    assert cache.get('second') is None
+    assert cache.info() == (1, 2, 1, 2 * size, 2 * size + 40, 2)
+    cache.put('fourth', pd.DataFrame({'odds': np.ones(100)}))
+    assert cache.get('fourth') is None
+    assert cache.clear().info() == (0, 0, 0, 0, 2 * size + 40, 0)
+
+
+def test_data_cache_shared(server_url):
+    """Test that the loaded data are shared by the dataloaders."""
+    X_train, *_ = SoccerDataLoader().extract_train_data(odds_type='market_average')
+    DataHandler.requests.clear()
+    X_train_shared, *_ = SoccerDataLoader().extract_train_data(odds_type='market_average')
+    pd.testing.assert_frame_equal(X_train_shared, X_train)
+    assert DataHandler.requests == []
+    assert DATA_CACHE.info().hits > 0
+    DATA_CACHE.clear()
+    SoccerDataLoader().extract_train_data(odds_type='market_average')
+    assert DataHandler.requests
+
+
+def test_get_odds_types_counts(server_url):
+    """Test that the odds types of stored closed seasons are found without loading the data."""
+    pytest.importorskip('pyarrow')
+    dataloader = SoccerDataLoader(param_grid={'year': [2020]})
+    assert dataloader._check_param_grid()._get_counts() is None
+    assert dataloader.get_odds_types() == ['market_average']
+    counts = dataloader._get_counts()
+    cols = ['target__away_team__full_time_goals', 'odds__market_average__draw__full_time_goals']
+    assert counts[cols].tolist() == [2, 2]
+    DATA_CACHE.clear()
+    DataHandler.requests.clear()
+    assert SoccerDataLoader(param_grid={'year': [2020]}).get_odds_types() == ['market_average']
+    assert DataHandler.requests == []
+    assert DATA_CACHE.info().length == 0
+
+
+def test_extract_outputs():
+    """Test that the vectorized outputs are equal to the outputs of the default functions."""
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            'target__home_team__full_time_goals': rng.integers(0, 6, 100).astype(float),
+            'target__away_team__full_time_goals': rng.integers(0, 6, 100).astype(float),
+        },
+    )
+    output_cols = [col for col, _ in OUTPUTS]
+    outputs = _extract_outputs(data, [*output_cols, 'output__over_0.5__full_time_goals'])
+    expected_outputs = np.column_stack([func(data) for _, func in OUTPUTS])
+    np.testing.assert_array_equal(outputs[:, :-1], expected_outputs)
+    np.testing.assert_array_equal(outputs[:, -1], data.sum(axis=1) >= 1)
+    assert _extract_outputs(data, ['output__asian_handicap__full_time_goals']) is None
+    assert _extract_outputs(data, ['output__home_win__half_time_goals']) is None
+
+
+def test_n_jobs(server_url):
+    """Test that the data parsed by a pool of processes are equal to the data parsed by threads."""
+    X_train, Y_train, O_train = SoccerDataLoader().extract_train_data(odds_type='market_average')
+    DATA_CACHE.clear()
+    for path in _data._get_data_home().glob('parquet/*'):
+        path.unlink()
+    X_train_jobs, Y_train_jobs, O_train_jobs = SoccerDataLoader(n_jobs=2).extract_train_data(odds_type='market_average')
+    pd.testing.assert_frame_equal(X_train_jobs, X_train)
+    pd.testing.assert_frame_equal(Y_train_jobs, Y_train)
+    pd.testing.assert_frame_equal(O_train_jobs, O_train)
+
+
+def test_n_jobs_stored(server_url):
+    """Test that the data of stored closed seasons are loaded again by a pool of processes."""
+    X_train, _, _ = SoccerDataLoader({'year': [2020]}, n_jobs=2).extract_train_data()
+    DATA_CACHE.clear()
+    X_train_stored, _, _ = SoccerDataLoader({'year': [2020]}, n_jobs=2).extract_train_data()
+    pd.testing.assert_frame_equal(X_train_stored, X_train)
+    assert _read_csvs([], n_jobs=2) == []
+
+
+def test_n_jobs_spawn(server_url, monkeypatch):
+    """Test that the pool of processes does not fork the process with the running client thread."""
+    start_methods = []
+    process_pool_executor = _utils.ProcessPoolExecutor
+
+    def recorded_process_pool_executor(*args, **kwargs):
+        start_methods.append(kwargs['mp_context'].get_start_method())
+        return process_pool_executor(*args, **kwargs)
+
+    monkeypatch.setattr(_utils, 'ProcessPoolExecutor', recorded_process_pool_executor)
+    SoccerDataLoader({'year': [2021]}, n_jobs=2).extract_train_data()
+    assert start_methods == ['spawn']
+
+
+def test_extract_train_data_async(server_url):
+    """Test that the training data of multiple dataloaders are extracted concurrently."""
+    param_grids = [{'year': [2020]}, {'year': [2021]}]
+
+    async def extract() -> list:
+        dataloaders = [SoccerDataLoader(param_grid) for param_grid in param_grids]
+        return await asyncio.gather(*[dataloader.aextract_train_data() for dataloader in dataloaders])
+
+    for (X_train_async, Y_train_async, _), param_grid in zip(asyncio.run(extract()), param_grids, strict=True):
+        X_train, Y_train, _ = SoccerDataLoader(param_grid).extract_train_data()
+        pd.testing.assert_frame_equal(X_train_async, X_train)
+        pd.testing.assert_frame_equal(Y_train_async, Y_train)
+
+
+def test_data_source_mirror(server_url, tmp_path):
+    """Test that the data are loaded from a local mirror without any request."""
+    dataloader = SoccerDataLoader().mirror(tmp_path / 'mirror')
+    X_train, Y_train, O_train = dataloader.extract_train_data(odds_type='market_average')
+    assert sorted(path.name for path in (tmp_path / 'mirror').iterdir()) == [path[1:] for path in sorted(CONTENT)]
+    DATA_CACHE.clear()
+    DataHandler.requests.clear()
+    dataloader = SoccerDataLoader(data_source=tmp_path / 'mirror')
+    X_train_mirror, Y_train_mirror, O_train_mirror = dataloader.extract_train_data(odds_type='market_average')
+    X_fix_mirror, _, _ = dataloader.extract_fixtures_data()
+    pd.testing.assert_frame_equal(X_train_mirror, X_train)
+    pd.testing.assert_frame_equal(Y_train_mirror, Y_train)
+    pd.testing.assert_frame_equal(O_train_mirror, O_train)
+    assert X_fix_mirror['home_team'].tolist() == ['Liverpool']
+    dataloader.refresh()
+    assert DataHandler.requests == []
+
+
+def test_data_source_mirror_unrelated_files(server_url, tmp_path):
+    """Test that the files of a local mirror with names of other formats are ignored."""
+    mirror = tmp_path / 'mirror'
+    SoccerDataLoader().mirror(mirror)
+    for name in ('notes.csv', 'E0.csv', 'England_1_2021_old.csv'):
+        (mirror / name).write_text(COLUMNS, encoding=ENCODING)
+    X_train, *_ = SoccerDataLoader().extract_train_data(odds_type='market_average')
+    dataloader = SoccerDataLoader(data_source=mirror)
+    assert list(dataloader._get_available_param_grid()) == list(SoccerDataLoader._get_full_param_grid())
+    X_train_mirror, *_ = dataloader.extract_train_data(odds_type='market_average')
+    pd.testing.assert_frame_equal(X_train_mirror, X_train)
+
+
+def test_data_source_store(server_url):
+    """Test that the data of closed seasons are loaded from the store without any request."""
+    dataloader = SoccerDataLoader()
+    X_train, Y_train, _ = dataloader.extract_train_data()
+    X_fix, _, _ = dataloader.extract_fixtures_data()
+    DATA_CACHE.clear()
+    DataHandler.requests.clear()
+    dataloader = SoccerDataLoader(data_source='store')
+    X_train_store, Y_train_store, _ = dataloader.extract_train_data()
+    X_fix_store, _, _ = dataloader.extract_fixtures_data()
+    assert DataHandler.requests == []
+    assert list(dataloader.param_grid_) == [{'league': 'England', 'division': 1, 'year': 2020}]
+    mask = X_train['year'].isin(dataloader.param_grid_.param_grid[0]['year']).to_numpy()
+    pd.testing.assert_frame_equal(X_train_store, X_train[mask])
+    pd.testing.assert_frame_equal(Y_train_store, Y_train[mask].reset_index(drop=True))
+    pd.testing.assert_frame_equal(X_fix_store, X_fix)
+
+
+@pytest.mark.parametrize(('data_source', 'error'), [('missing', ValueError), (5, TypeError)])
+def test_data_source_raise_error(data_source, error):
+    """Test the raise of error for wrong data source."""
+    with pytest.raises(error, match='Parameter `data_source` should be either'):
+        SoccerDataLoader(data_source=data_source).extract_train_data()
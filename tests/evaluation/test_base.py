@@ -7,7 +7,8 @@ import pandas as pd
 import pytest
 from sklearn.exceptions import NotFittedError
 
-from sportsbet.evaluation._base import BaseBettor
+from sportsbet.evaluation import _base
+from sportsbet.evaluation._base import BaseBettor, _get_daily_returns, _trusted_data
 from tests.evaluation import O_train, TestBettor, X_train, Y_train
 
 
@@ -262,3 +263,62 @@ def test_bet():
         ],
     )
     assert np.array_equal(bettor.bet(X_train, O_train), expected_value_bets)
+
+
+def test_bet_complementary_events():
+    """Test that at most one value bet is selected for each group of complementary events."""
+    bettor = TestBettor()
+    bettor.fit(X_train, Y_train)
+    O = O_train.copy()
+    O.iloc[:, :] = 3.3
+    O.iloc[0, 0] = 4.0
+    O.iloc[1, 1] = np.nan
+    value_bets = bettor.bet(X_train, O)
+    assert value_bets.sum(axis=1).tolist() == [1] * X_train.shape[0]
+    assert value_bets[0].tolist() == [True, False, False]
+    assert value_bets[1:, -1].all()
+
+
+def test_columns_resolution_cached():
+    """Test that the resolution of the columns is shared by the slices of the data."""
+    bettor = TestBettor(betting_markets=['home_win__full_time_goals', 'away_win__full_time_goals'])
+    bettor.fit(X_train, Y_train)
+    positions = bettor._get_odds_positions(O_train)
+    assert bettor._get_odds_positions(O_train.iloc[1:]) is positions
+    assert bettor._get_output_positions(Y_train.iloc[1:]) is bettor._get_output_positions(Y_train)
+    assert np.array_equal(bettor.bet(X_train.iloc[1:], O_train.iloc[1:]), bettor.bet(X_train, O_train)[1:])
+    O = O_train.rename(columns=lambda col: col.replace('odds', 'o'))
+    error_msg = 'Prefixes of odds data column names should be equal to `odds`.'
+    for _ in range(2):
+        with pytest.raises(ValueError, match=re.escape(error_msg)):
+            bettor.bet(X_train, O)
+    with pytest.raises(KeyError):
+        bettor.score(X_train, Y_train.iloc[:, 1:], O_train.iloc[:, 1:])
+
+
+def test_trusted_data_skip_validation(monkeypatch):
+    """Test that the validation of the trusted data and their slices is skipped."""
+    bettor = TestBettor().fit(X_train, Y_train, O_train)
+    n_checks = []
+    monkeypatch.setattr(_base, 'check_consistent_length', lambda *data: n_checks.append(len(data)))
+    with _trusted_data(X_train, Y_train, O_train):
+        value_bets = bettor.bet(X_train.iloc[1:], O_train.iloc[1:])
+        bettor.score(X_train.iloc[1:], Y_train.iloc[1:], O_train.iloc[1:])
+        assert not n_checks
+        bettor.bet(X_train[X_train.columns], O_train)
+        assert n_checks
+    assert np.array_equal(value_bets, bettor.bet(X_train, O_train)[1:])
+
+
+def test_get_daily_returns():
+    """Test the aggregation of the returns into daily returns."""
+    dates = pd.DatetimeIndex(['2020-01-03', '2020-01-01', '2020-01-03', '2020-01-03 12:00', '2020-01-06'], name='date')
+    returns = np.array([0.1, -1.0, 0.2, 5.0, 0.7])
+    np.testing.assert_allclose(_get_daily_returns(dates, returns), [-1.0, 0.0, 0.1 + 0.2, 0.0, 0.0, 0.7])
+    assert _get_daily_returns(dates[:0], returns[:0]).size == 0
+    rng = np.random.default_rng(0)
+    dates = pd.DatetimeIndex(pd.Timestamp('2020-01-01') + pd.to_timedelta(rng.integers(0, 30, 500), 'D'), name='date')
+    returns = rng.normal(size=500)
+    expected = pd.Series(returns, index=dates).groupby('date').sum()
+    expected = expected.reindex(pd.date_range(dates.min(), dates.max()), fill_value=0.0).to_numpy()
+    np.testing.assert_allclose(_get_daily_returns(dates, returns), expected)
@@ -1,5 +1,6 @@
 """Test the backtest function and GridSearchCV class."""
 
+import re
 from datetime import datetime
 from typing import cast
 
@@ -9,7 +10,7 @@ import pytest
 from sklearn.dummy import DummyClassifier
 from sklearn.model_selection import KFold, TimeSeriesSplit
 
-from sportsbet.evaluation import BettorGridSearchCV, ClassifierBettor, OddsComparisonBettor, backtest
+from sportsbet.evaluation import BettingScorer, BettorGridSearchCV, ClassifierBettor, OddsComparisonBettor, backtest
 from tests.evaluation import O_train, TestBettor, X_train, Y_train
 
 
@@ -123,6 +124,18 @@ def test_bgscv_fit_raise_type_error_wrong_cross_validator(cv):
         bgscv.fit(X_train, Y_train, O_train)
 
 
+def test_bgscv_fit_raise_value_error_inconsistent_data():
+    """Test raising an error on inconsistent data length."""
+    bgscv = BettorGridSearchCV(TestBettor(), {})
+    with pytest.raises(
+        ValueError,
+        match=re.escape(
+            f'Found input variables with inconsistent numbers of samples: [{X_train.shape[0] - 1}, {Y_train.shape[0]}]',
+        ),
+    ):
+        bgscv.fit(X_train.iloc[:-1], Y_train, O_train)
+
+
 @pytest.mark.parametrize('n_splits', [2, 3, 4])
 def test_bgscv_fit(n_splits):
     """Test the fit of bettor grid search cross validation."""
@@ -191,3 +204,64 @@ def test_bgscv_fit(n_splits):
     assert bgscv.stake_ == bgscv.best_estimator_.stake_
     assert np.array_equal(bgscv.feature_names_in_, bgscv.best_estimator_.feature_names_in_)
     assert np.array_equal(bgscv.feature_names_out_, bgscv.best_estimator_.feature_names_out_)
+
+
+@pytest.mark.parametrize('metrics', ['roi', ('roi',)])
+def test_betting_scorer_raise_type_error_metrics(metrics):
+    """Test raising an error on wrong type of metrics."""
+    bettor = TestBettor().fit(X_train, Y_train, O_train)
+    with pytest.raises(TypeError, match='Parameter `metrics` should be a list of betting metrics'):
+        BettingScorer(metrics=metrics)(bettor, X_train, Y_train, O_train)
+
+
+@pytest.mark.parametrize('metrics', [[], ['roi', 'profit']])
+def test_betting_scorer_raise_value_error_metrics(metrics):
+    """Test raising an error on wrong metrics."""
+    bettor = TestBettor().fit(X_train, Y_train, O_train)
+    with pytest.raises(ValueError, match='Parameter `metrics` should be a list of betting metrics'):
+        BettingScorer(metrics=metrics)(bettor, X_train, Y_train, O_train)
+
+
+def test_betting_scorer():
+    """Test the betting metrics of the scorer."""
+    bettor = TestBettor(init_cash=1000.0, stake=10.0).fit(X_train, Y_train, O_train)
+    scores = BettingScorer()(bettor, X_train, Y_train, O_train)
+    value_bets = bettor.bet(X_train, O_train)
+    returns = np.nan_to_num((Y_train.to_numpy() * O_train.to_numpy() - 1) * value_bets)
+    cash = 1000.0 + 10.0 * np.cumsum(
+        pd.Series(returns.sum(axis=1), index=X_train.index)
+        .groupby('date')
+        .sum()
+        .reindex(pd.date_range(X_train.index.min(), X_train.index.max()), fill_value=0.0),
+    )
+    assert list(scores) == list(BettingScorer.METRICS)
+    assert scores['sharpe_ratio'] == bettor.score(X_train, Y_train, O_train)
+    assert scores['yield'] == pytest.approx(returns[value_bets].mean())
+    assert scores['roi'] == pytest.approx(10.0 * returns.sum() / 1000.0)
+    assert scores['hit_rate'] == pytest.approx((Y_train.to_numpy() & value_bets).sum() / value_bets.sum())
+    assert scores['max_drawdown'] == pytest.approx(min(0.0, (cash / np.maximum.accumulate(cash) - 1).min()))
+    assert list(BettingScorer(metrics=['roi'])(bettor, X_train, Y_train, O_train)) == ['roi']
+
+
+def test_bgscv_fit_betting_scorer_raise_type_error_no_odds():
+    """Test raising an error when no odds are provided to the betting scorer."""
+    bgscv = BettorGridSearchCV(TestBettor(), {}, scoring=BettingScorer(), refit='roi')
+    with pytest.raises(TypeError, match=re.escape('The betting scorer requires the odds data `O` to be provided.')):
+        bgscv.fit(X_train, Y_train)
+
+
+@pytest.mark.parametrize('refit', ['sharpe_ratio', 'yield', 'roi', 'hit_rate', 'max_drawdown'])
+def test_bgscv_fit_betting_scorer(refit):
+    """Test the fit of bettor grid search cross validation with the betting scorer."""
+    param_grid = {'betting_markets': [None, ['draw__full_time_goals'], ['home_win__full_time_goals']]}
+    bgscv = BettorGridSearchCV(TestBettor(), param_grid, cv=TimeSeriesSplit(2)).fit(X_train, Y_train, O_train)
+    bgscv_metrics = BettorGridSearchCV(
+        TestBettor(),
+        param_grid,
+        scoring=BettingScorer(),
+        refit=refit,
+        cv=TimeSeriesSplit(2),
+    ).fit(X_train, Y_train, O_train)
+    assert np.array_equal(bgscv.cv_results_['mean_test_score'], bgscv_metrics.cv_results_['mean_test_sharpe_ratio'])
+    assert bgscv_metrics.best_index_ == np.argmax(bgscv_metrics.cv_results_[f'mean_test_{refit}'])
+    assert bgscv_metrics.bet(X_train, O_train).shape[0] == X_train.shape[0]